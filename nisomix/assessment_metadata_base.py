@@ -12,24 +12,40 @@ References:
 
 """
 
-from nisomix.base import (_element, _ensure_list, _rationaltype_element,
-                          _subelement)
-from nisomix.constants import (BITS_PER_SAMPLE_UNITS, EXTRA_SAMPLES_TYPES,
-                               GRAY_RESPONSE_UNITS, SAMPLING_FREQUENCY_PLANES,
-                               SAMPLING_FREQUENCY_UNITS, TARGET_TYPES)
-from nisomix.utils import (RestrictedElementError, assessment_metadata_order,
-                           color_encoding_order, target_data_order)
+from nisomix.base import (_append_slots, _container, _ensure_sequence,
+                          _optional_subelements, _ordered_slots,
+                          _rational_given, _rationaltype_element,
+                          _TextElement, _text_subelement, _text_subelements,
+                          mix_ns)
+from nisomix.constants import (BITS_PER_SAMPLE_UNITS,
+                               BITS_PER_SAMPLE_UNITS_SET, EXTRA_SAMPLES_TYPES,
+                               EXTRA_SAMPLES_TYPES_SET, GRAY_RESPONSE_UNITS,
+                               GRAY_RESPONSE_UNITS_SET,
+                               SAMPLING_FREQUENCY_PLANES,
+                               SAMPLING_FREQUENCY_PLANES_SET,
+                               SAMPLING_FREQUENCY_UNITS,
+                               SAMPLING_FREQUENCY_UNITS_SET, TARGET_TYPES,
+                               TARGET_TYPES_SET)
+from nisomix.utils import (ASSESSMENT_METADATA_ORDER, COLOR_ENCODING_ORDER,
+                           TARGET_DATA_ORDER, RestrictedElementError)
 
 __all__ = ['image_assessment_metadata', 'spatial_metrics', 'color_encoding',
            'bits_per_sample', 'color_map', 'gray_response', 'white_point',
            'primary_chromaticities', 'target_data', 'target_id']
 
+# Children of PrimaryChromaticities in the schema order
+_CHROMATICITY_TAGS = (
+    'primaryChromaticitiesRedX', 'primaryChromaticitiesRedY',
+    'primaryChromaticitiesGreenX', 'primaryChromaticitiesGreenY',
+    'primaryChromaticitiesBlueX', 'primaryChromaticitiesBlueY')
 
-def image_assessment_metadata(child_elements=None):
+
+def image_assessment_metadata(child_elements=None, parent=None):
     """
     Returns the MIX ImageAssessmentMetadata element.
 
     :child_elements: Child elements as a list
+    :parent: Parent element for the created element (optional)
 
     Returns the following sorted ElementTree structure::
 
@@ -40,16 +56,16 @@ def image_assessment_metadata(child_elements=None):
         </mix:ImageAssessmentMetadata>
 
     """
-    container = _element('ImageAssessmentMetadata')
-    if child_elements:
-        child_elements.sort(key=assessment_metadata_order)
-        for element in child_elements:
-            container.append(element)
+    slots = _ordered_slots(child_elements, ASSESSMENT_METADATA_ORDER,
+                           'ImageAssessmentMetadata')
+    container = _container('ImageAssessmentMetadata', parent)
+    _append_slots(container, slots)
 
     return container
 
 
-def spatial_metrics(plane=None, unit=None, x_sampling=None, y_sampling=None):
+def spatial_metrics(plane=None, unit=None, x_sampling=None, y_sampling=None,
+                    parent=None):
     """
     Returns the MIX SpatialMetrics element.
 
@@ -57,6 +73,7 @@ def spatial_metrics(plane=None, unit=None, x_sampling=None, y_sampling=None):
     :unit: The sampling frequency unit as a string
     :x_sampling: The y sampling frequency as a list (or integer)
     :y_sampling: The x sampling frequency as a list (or integer)
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -76,29 +93,27 @@ def spatial_metrics(plane=None, unit=None, x_sampling=None, y_sampling=None):
         </mix:SpatialMetrics>
 
     """
-    container = _element('SpatialMetrics')
+    if plane and plane not in SAMPLING_FREQUENCY_PLANES_SET:
+        raise RestrictedElementError(
+            plane, 'samplingFrequencyPlane', SAMPLING_FREQUENCY_PLANES)
+
+    if unit and unit not in SAMPLING_FREQUENCY_UNITS_SET:
+        raise RestrictedElementError(
+            unit, 'samplingFrequencyUnit', SAMPLING_FREQUENCY_UNITS)
+
+    container = _container('SpatialMetrics', parent)
 
     if plane:
-        plane_el = _subelement(container, 'samplingFrequencyPlane')
-        if plane in SAMPLING_FREQUENCY_PLANES:
-            plane_el.text = plane
-        else:
-            raise RestrictedElementError(
-                plane, 'samplingFrequencyPlane', SAMPLING_FREQUENCY_PLANES)
+        _text_subelement(container, 'samplingFrequencyPlane', plane)
 
     if unit:
-        unit_el = _subelement(container, 'samplingFrequencyUnit')
-        if unit in SAMPLING_FREQUENCY_UNITS:
-            unit_el.text = unit
-        else:
-            raise RestrictedElementError(
-                unit, 'samplingFrequencyUnit', SAMPLING_FREQUENCY_UNITS)
-
-    if x_sampling:
+        _text_subelement(container, 'samplingFrequencyUnit', unit)
+
+    if _rational_given(x_sampling):
         _rationaltype_element('xSamplingFrequency', x_sampling,
                               parent=container)
 
-    if y_sampling:
+    if _rational_given(y_sampling):
         _rationaltype_element('ySamplingFrequency', y_sampling,
                               parent=container)
 
@@ -106,13 +121,14 @@ def spatial_metrics(plane=None, unit=None, x_sampling=None, y_sampling=None):
 
 
 def color_encoding(samples_pixel=None, extra_samples=None,
-                   child_elements=None):
+                   child_elements=None, parent=None):
     """
     Returns the MIX ImageColorEncoding element.
 
     :samples_pixel: The number of samples per pixel as an integer
     :extra_samples: The types of extra samples as a list
     :child_elements: Child elements as a list
+    :parent: Parent element for the created element (optional)
 
     Returns the following sorted ElementTree structure::
 
@@ -127,41 +143,36 @@ def color_encoding(samples_pixel=None, extra_samples=None,
         </mix:ImageColorEncoding>
 
     """
-    container = _element('ImageColorEncoding')
-
-    if child_elements is None:
-        child_elements = []
+    text_elements = []
 
     if samples_pixel:
-        pixel_el = _element('samplesPerPixel')
-        pixel_el.text = str(samples_pixel)
-        child_elements.append(pixel_el)
+        text_elements.append(
+            _TextElement(mix_ns('samplesPerPixel'), str(samples_pixel)))
 
     if extra_samples:
-        extra_samples = _ensure_list(extra_samples)
-        for item in extra_samples:
-            if item in EXTRA_SAMPLES_TYPES:
-                samples_el = _element('extraSamples')
-                samples_el.text = item
-                child_elements.append(samples_el)
+        for item in _ensure_sequence(extra_samples):
+            if item in EXTRA_SAMPLES_TYPES_SET:
+                text_elements.append(
+                    _TextElement(mix_ns('extraSamples'), item))
             else:
                 raise RestrictedElementError(
                     item, 'extraSamples', EXTRA_SAMPLES_TYPES)
 
-    child_elements.sort(key=color_encoding_order)
-
-    for element in child_elements:
-        container.append(element)
+    slots = _ordered_slots(child_elements, COLOR_ENCODING_ORDER,
+                           'ImageColorEncoding', text_elements)
+    container = _container('ImageColorEncoding', parent)
+    _append_slots(container, slots)
 
     return container
 
 
-def bits_per_sample(sample_values=None, sample_unit=None):
+def bits_per_sample(sample_values=None, sample_unit=None, parent=None):
     """
     Returns the MIX BitsPerSample element.
 
     :sample_values: The bits per sample values as a list
     :sample_unit: The bits per sample unit as a string
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -171,31 +182,28 @@ def bits_per_sample(sample_values=None, sample_unit=None):
         </mix:BitsPerSample>
 
     """
-    container = _element('BitsPerSample')
+    if sample_unit and sample_unit not in BITS_PER_SAMPLE_UNITS_SET:
+        raise RestrictedElementError(
+            sample_unit, 'bitsPerSampleUnit', BITS_PER_SAMPLE_UNITS)
+
+    container = _container('BitsPerSample', parent)
 
     if sample_values:
-        sample_values = _ensure_list(sample_values)
-        for item in sample_values:
-            value_el = _subelement(container, 'bitsPerSampleValue')
-            value_el.text = str(item)
+        _text_subelements(container, 'bitsPerSampleValue', sample_values)
 
     if sample_unit:
-        if sample_unit in BITS_PER_SAMPLE_UNITS:
-            unit_el = _subelement(container, 'bitsPerSampleUnit')
-            unit_el.text = sample_unit
-        else:
-            raise RestrictedElementError(
-                sample_unit, 'bitsPerSampleUnit', BITS_PER_SAMPLE_UNITS)
+        _text_subelement(container, 'bitsPerSampleUnit', sample_unit)
 
     return container
 
 
-def color_map(reference=None, embedded=None):
+def color_map(reference=None, embedded=None, parent=None):
     """
     Returns the MIX Colormap element.
 
     :reference: The location of the referenced color map as a string
     :embedded: The embedded color map as base64-encoded data
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -205,25 +213,20 @@ def color_map(reference=None, embedded=None):
         </mix:Colormap>
 
     """
-    container = _element('Colormap')
-
-    if reference:
-        reference_el = _subelement(container, 'colormapReference')
-        reference_el.text = reference
-
-    if embedded:
-        embedded_el = _subelement(container, 'embeddedColormap')
-        embedded_el.text = str(embedded)
+    container = _container('Colormap', parent)
+    _optional_subelements(container, (('colormapReference', reference),
+                                      ('embeddedColormap', embedded)))
 
     return container
 
 
-def gray_response(curves=None, unit=None):
+def gray_response(curves=None, unit=None, parent=None):
     """
     Returns the MIX GrayResponse element.
 
     :curves: The optical density of pixels as a list (of integers)
     :unit: The precision recorded in grayResponseCurve
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -235,31 +238,28 @@ def gray_response(curves=None, unit=None):
         </mix:GrayResponse>
 
     """
-    container = _element('GrayResponse')
+    if unit and unit not in GRAY_RESPONSE_UNITS_SET:
+        raise RestrictedElementError(
+            unit, 'grayResponseUnit', GRAY_RESPONSE_UNITS)
+
+    container = _container('GrayResponse', parent)
 
     if curves:
-        curves = _ensure_list(curves)
-        for item in curves:
-            curve_el = _subelement(container, 'grayResponseCurve')
-            curve_el.text = str(item)
+        _text_subelements(container, 'grayResponseCurve', curves)
 
     if unit:
-        if unit in GRAY_RESPONSE_UNITS:
-            unit_el = _subelement(container, 'grayResponseUnit')
-            unit_el.text = unit
-        else:
-            raise RestrictedElementError(
-                unit, 'grayResponseUnit', GRAY_RESPONSE_UNITS)
+        _text_subelement(container, 'grayResponseUnit', unit)
 
     return container
 
 
-def white_point(x_value=None, y_value=None):
+def white_point(x_value=None, y_value=None, parent=None):
     """
     Returns the MIX WhitePoint element.
 
     :x_value: The X value of white point chromaticity as a list
     :y_value: The Y value of white point chromaticity as a list
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -275,20 +275,19 @@ def white_point(x_value=None, y_value=None):
         </mix:WhitePoint>
 
     """
-    container = _element('WhitePoint')
+    container = _container('WhitePoint', parent)
 
-    if x_value:
-        _rationaltype_element('whitePointXValue', x_value, parent=container)
-
-    if y_value:
-        _rationaltype_element('whitePointYValue', y_value, parent=container)
+    for tag, value in (('whitePointXValue', x_value),
+                       ('whitePointYValue', y_value)):
+        if _rational_given(value):
+            _rationaltype_element(tag, value, parent=container)
 
     return container
 
 
 # pylint: disable=too-many-arguments
 def primary_chromaticities(red_x=None, red_y=None, green_x=None, green_y=None,
-                           blue_x=None, blue_y=None):
+                           blue_x=None, blue_y=None, parent=None):
     """
     Returns the MIX PrimaryChromaticities element.
 
@@ -298,6 +297,7 @@ def primary_chromaticities(red_x=None, red_y=None, green_x=None, green_y=None,
     :red_x: The green Y value for the chromaticities as a list
     :red_x: The blue X value for the chromaticities as a list
     :red_x: The blue Y value for the chromaticities as a list
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -329,38 +329,18 @@ def primary_chromaticities(red_x=None, red_y=None, green_x=None, green_y=None,
         </mix:PrimaryChromaticities>
 
     """
-    container = _element('PrimaryChromaticities')
-
-    if red_x:
-        _rationaltype_element('primaryChromaticitiesRedX', red_x,
-                              parent=container)
-
-    if red_y:
-        _rationaltype_element('primaryChromaticitiesRedY', red_y,
-                              parent=container)
+    container = _container('PrimaryChromaticities', parent)
 
-    if green_x:
-        _rationaltype_element('primaryChromaticitiesGreenX', green_x,
-                              parent=container)
-
-    if green_y:
-        _rationaltype_element('primaryChromaticitiesGreenY', green_y,
-                              parent=container)
-
-    if blue_x:
-        _rationaltype_element('primaryChromaticitiesBlueX', blue_x,
-                              parent=container)
-
-    if blue_y:
-        _rationaltype_element('primaryChromaticitiesBlueY', blue_y,
-                              parent=container)
+    values = (red_x, red_y, green_x, green_y, blue_x, blue_y)
+    for tag, value in zip(_CHROMATICITY_TAGS, values):
+        if _rational_given(value):
+            _rationaltype_element(tag, value, parent=container)
 
     return container
 
 
-# pylint: disable=too-many-branches
 def target_data(target_types=None, external_targets=None,
-                performance_data=None, child_elements=None):
+                performance_data=None, child_elements=None, parent=None):
     """
     Returns MIX TargetData element.
 
@@ -368,6 +348,7 @@ def target_data(target_types=None, external_targets=None,
     :external_targets: The locations of external targets as a list
     :performance_data: The location of performance data as a string
     :child_elements: Child elements as a list
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -379,45 +360,33 @@ def target_data(target_types=None, external_targets=None,
         </mix:TargetData>
 
     """
-    container = _element('TargetData')
-
-    if child_elements is None:
-        child_elements = []
+    text_elements = []
 
     if target_types:
-        target_types = _ensure_list(target_types)
+        target_types = _ensure_sequence(target_types)
         for item in target_types:
-            if item in TARGET_TYPES:
-                type_el = _element('targetType')
-                type_el.text = item
-                child_elements.append(type_el)
-            else:
+            if item not in TARGET_TYPES_SET:
                 raise RestrictedElementError(
                     item, 'targetType', TARGET_TYPES)
 
-    if external_targets:
-        external_targets = _ensure_list(external_targets)
-        for item in external_targets:
-            target_el = _element('externalTarget')
-            target_el.text = item
-            child_elements.append(target_el)
-
-    if performance_data:
-        performance_data = _ensure_list(performance_data)
-        for item in performance_data:
-            data_el = _element('performanceData')
-            data_el.text = item
-            child_elements.append(data_el)
+    for tag, values in (('targetType', target_types),
+                        ('externalTarget', external_targets),
+                        ('performanceData', performance_data)):
+        if values:
+            tag = mix_ns(tag)
+            text_elements.extend(
+                _TextElement(tag, item) for item in _ensure_sequence(values))
 
-    child_elements.sort(key=target_data_order)
-
-    for element in child_elements:
-        container.append(element)
+    slots = _ordered_slots(child_elements, TARGET_DATA_ORDER, 'TargetData',
+                           text_elements)
+    container = _container('TargetData', parent)
+    _append_slots(container, slots)
 
     return container
 
 
-def target_id(manufacturer=None, name=None, target_no=None, media=None):
+def target_id(manufacturer=None, name=None, target_no=None, media=None,
+              parent=None):
     """
     Returns MIX TargetID element.
 
@@ -425,6 +394,7 @@ def target_id(manufacturer=None, name=None, target_no=None, media=None):
     :name: The target name as a string
     :target_no: The target version or number as a string
     :media: The target media as a string
+    :parent: Parent element for the created element (optional)
 
     Returns the following ElementTree structure::
 
@@ -436,22 +406,10 @@ def target_id(manufacturer=None, name=None, target_no=None, media=None):
         </mix:TargetID>
 
     """
-    container = _element('TargetID')
-
-    if manufacturer:
-        manufacturer_el = _subelement(container, 'targetManufacturer')
-        manufacturer_el.text = manufacturer
-
-    if name:
-        name_el = _subelement(container, 'targetName')
-        name_el.text = name
-
-    if target_no:
-        target_no_el = _subelement(container, 'targetNo')
-        target_no_el.text = target_no
-
-    if media:
-        media_el = _subelement(container, 'targetMedia')
-        media_el.text = media
+    container = _container('TargetID', parent)
+    _optional_subelements(container, (('targetManufacturer', manufacturer),
+                                      ('targetName', name),
+                                      ('targetNo', target_no),
+                                      ('targetMedia', media)))
 
     return container
@@ -13,13 +13,31 @@ References:
 
 """
 
+from collections import namedtuple
+from functools import lru_cache
+
 import lxml.etree as ET
-from nisomix.utils import MIX_NS, NAMESPACES, mix_root_order
+from nisomix.utils import (ASSESSMENT_METADATA_ORDER, COLOR_ENCODING_ORDER,
+                           MIX_NS, MIX_ROOT_ORDER, NAMESPACES,
+                           TARGET_DATA_ORDER, _order_position)
 from xml_helpers.utils import xsi_ns
 
 __all__ = ['mix_ns', 'mix']
 
+# Text element which is created directly into its parent element once
+# the position of the element among its siblings is known. The tag is
+# given in the same namespaced form as in lxml elements so that the
+# positions of both are looked up from the same *_ORDER dicts.
+_TextElement = namedtuple('_TextElement', ['tag', 'text'])
+
+# Maximum number of cached namespaced tag names. The MIX schema has a
+# few hundred element names, so every tag used by the builders stays
+# cached, while arbitrary tags built by callers cannot grow the cache
+# without limit.
+_TAG_CACHE_SIZE = 1024
+
 
+@lru_cache(maxsize=_TAG_CACHE_SIZE)
 def mix_ns(tag, prefix=""):
     """Prefix ElementTree tags with MIX namespace.
 
@@ -33,6 +51,9 @@ def mix_ns(tag, prefix=""):
         element.tag
         'linkingObjectIdentifier'
 
+    The results are cached, so the same tag name is not formatted again
+    on every call.
+
     :tag: The tag name as string
     :prefix: Prefix for the tag to be appended to the tag name
              (default="")
@@ -40,11 +61,33 @@ def mix_ns(tag, prefix=""):
 
     """
     if prefix:
-        tag = tag[0].upper() + tag[1:]
-        return f'{{{MIX_NS}}}{prefix}{tag}'
+        tag = prefix + tag[0].upper() + tag[1:]
     return f'{{{MIX_NS}}}{tag}'
 
 
+# Namespace mapping of standalone elements. lxml copies the mapping into
+# the element, so the same dict is shared by all calls and must not be
+# modified.
+_DEFAULT_NSMAP = {'mix': MIX_NS}
+
+# The schema location attribute of the MIX root element
+_SCHEMA_LOCATION_ATTR = xsi_ns('schemaLocation')
+_SCHEMA_LOCATION = ('http://www.loc.gov/mix/v20 '
+                    'http://www.loc.gov/mix/mix.xsd')
+
+# The parts of every rational type element
+_NUMERATOR = mix_ns('numerator')
+_DENOMINATOR = mix_ns('denominator')
+
+# Schema order of the children of the container elements into which
+# elements can be created with the parent argument
+_CHILD_ORDERS = {
+    mix_ns('mix'): MIX_ROOT_ORDER,
+    mix_ns('ImageAssessmentMetadata'): ASSESSMENT_METADATA_ORDER,
+    mix_ns('ImageColorEncoding'): COLOR_ENCODING_ORDER,
+    mix_ns('TargetData'): TARGET_DATA_ORDER}
+
+
 def _element(tag, prefix="", namespaces=None):
     """Return lxml Element with MIX namespace. Given namespaces are
     mapped to the given prefixes.
@@ -56,15 +99,54 @@ def _element(tag, prefix="", namespaces=None):
 
     """
     if namespaces is None:
-        namespaces = {}
-    namespaces['mix'] = MIX_NS
+        namespaces = _DEFAULT_NSMAP
+    else:
+        namespaces['mix'] = MIX_NS
     return ET.Element(mix_ns(tag, prefix), nsmap=namespaces)
 
 
+def _container(tag, parent=None):
+    """Return a new MIX element. If parent element is given, the element
+    is created as a subelement of the parent instead of a standalone
+    element. The MIX namespace is declared in the element if it is not
+    already declared in the parent. If the parent is a MIX element with
+    a known order of children, the element is placed among the existing
+    children in the schema order, and ValueError is raised if the
+    element is not allowed in the parent. In other parents the element
+    is appended as the last child.
+
+    :tag: Tagname
+    :parent: Parent element (optional)
+    :returns: Created element
+
+    """
+    if parent is None:
+        return _element(tag)
+
+    tag = mix_ns(tag)
+    order = _CHILD_ORDERS.get(parent.tag)
+    if order is not None:
+        position = _order_position(order, tag, ET.QName(parent).localname)
+
+    if MIX_NS in parent.nsmap.values():
+        elem = ET.SubElement(parent, tag)
+    else:
+        elem = ET.SubElement(parent, tag, nsmap=_DEFAULT_NSMAP)
+
+    if order is not None:
+        for index, child in enumerate(parent):
+            if order.get(child.tag, -1) > position:
+                parent.insert(index, elem)
+                break
+
+    return elem
+
+
 def _subelement(parent, tag, prefix="", namespaces=None):
     """Return subelement for the given parent element. Created element
     is appended to parent element Given namespaces are mapped to the
-    given prefixes.
+    given prefixes. Without namespaces, the subelement uses the
+    namespace mapping of its parent.
 
     :parent: Parent element
     :tag: Element tagname
@@ -74,11 +156,68 @@ def _subelement(parent, tag, prefix="", namespaces=None):
 
     """
     if namespaces is None:
-        namespaces = {}
+        return ET.SubElement(parent, mix_ns(tag, prefix))
     namespaces['mix'] = MIX_NS
     return ET.SubElement(parent, mix_ns(tag, prefix), nsmap=namespaces)
 
 
+def _text_subelement(parent, tag, text, prefix=""):
+    """Return subelement with the given text content for the given parent
+    element. The subelement uses the namespace mapping of its parent.
+
+    :parent: Parent element
+    :tag: Element tagname
+    :text: Text content of the element
+    :prefix: Prefix for the tag
+    :returns: Created subelement
+
+    """
+    elem = ET.SubElement(parent, mix_ns(tag, prefix))
+    elem.text = text
+    return elem
+
+
+def _text_subelements(parent, tag, values):
+    """Create a subelement with text content for each of the given
+    values. Used for repeating elements, which accept either a single
+    value or a list of values.
+
+    :parent: Parent element
+    :tag: Element tagname
+    :values: The text contents as a list or a tuple (or a single value)
+
+    """
+    tag = mix_ns(tag)
+    subelement = ET.SubElement
+    for value in _ensure_sequence(values):
+        subelement(parent, tag).text = str(value)
+
+
+def _optional_subelements(parent, contents, prefix=""):
+    """Create a subelement with text content for each (tag, value) pair
+    whose value is given. Pairs with an empty value are skipped.
+
+    :parent: Parent element
+    :contents: The tag names and text contents as (tag, value) pairs
+    :prefix: Prefix for the tags
+
+    """
+    for tag, value in contents:
+        if value:
+            _text_subelement(parent, tag, str(value), prefix=prefix)
+
+
+def _rational_given(value):
+    """
+    Return True if the given rational type value is not missing. Zero
+    is a valid value, but None, an empty string and an empty list or
+    tuple are treated as missing.
+    """
+    if isinstance(value, (list, tuple)):
+        return len(value) > 0
+    return value is not None and value != ''
+
+
 def _rationaltype_element(tag, value, denominator='1', parent=None):
     """Return a rational type element. If parent element is given,
     return the rational element as a subelement of the parent.
@@ -91,30 +230,113 @@ def _rationaltype_element(tag, value, denominator='1', parent=None):
         </mix:{{ tag }}>
 
     :tag: Element tag name
-    :value: Contents of the numerator part of the element, or
-            if it is a list, contains both the numerator and denominator
+    :value: Contents of the numerator part of the element, or if it
+            is a list or a tuple, contains both the numerator and
+            denominator
     :denominator: Contents of the denominator part of the element
     :parent: The tag name of the parent element
 
     """
-    value = _ensure_list(value)
-    numerator = str(value[0])
-
-    if len(value) == 2 and value[1]:
-        denominator = str(value[1])
-
-    if parent is not None:
-        elem = _subelement(parent, tag)
+    if isinstance(value, (list, tuple)):
+        if not value:
+            raise ValueError('Empty value given for the rational type '
+                             f'element {tag}.')
+        numerator = str(value[0])
+        if len(value) == 2 and value[1]:
+            denominator = str(value[1])
     else:
-        elem = _element(tag)
-    numerator_el = _subelement(elem, 'numerator')
-    numerator_el.text = numerator
-    denominator_el = _subelement(elem, 'denominator')
-    denominator_el.text = denominator
+        numerator = str(value)
+
+    elem = _container(tag, parent)
+    ET.SubElement(elem, _NUMERATOR).text = numerator
+    ET.SubElement(elem, _DENOMINATOR).text = denominator
 
     return elem
 
 
+def _ordered_slots(child_elements, order, container, text_elements=None):
+    """Return the given child elements and text elements placed into
+    slots by their position in the order given as a dict of tags and
+    their positions. Elements with the same tag keep their original
+    order. Raises ValueError for elements which are not allowed in the
+    container, so the elements can be checked before the container
+    element is created.
+
+    :child_elements: Child elements as a list
+    :order: The positions of the allowed tags as a dict
+    :container: Tag name of the container element for error messages
+    :text_elements: Text elements as a list of _TextElement tuples
+    :returns: List of slots, which are None or lists of elements
+
+    """
+    slots = [None] * len(order)
+    for items in (child_elements, text_elements):
+        if not items:
+            continue
+        for item in items:
+            index = _order_position(order, item.tag, container)
+            slot = slots[index]
+            if slot is None:
+                slots[index] = [item]
+            else:
+                slot.append(item)
+
+    return slots
+
+
+def _append_slots(container, slots):
+    """Append the elements placed into slots by _ordered_slots() to the
+    container element. Text elements are created directly into the
+    container.
+
+    :container: Parent element
+    :slots: List of slots, which are None or lists of elements
+
+    """
+    subelement = ET.SubElement
+    append = container.append
+    for slot in slots:
+        if slot is None:
+            continue
+        for item in slot:
+            if isinstance(item, _TextElement):
+                subelement(container, item.tag).text = item.text
+            else:
+                append(item)
+
+
+def _append_ordered(container, child_elements, order, text_elements=None):
+    """Append the given child elements and text elements to the
+    container element in the order given as a dict of tags and their
+    positions. The elements are placed into slots by their position
+    instead of sorting them, and elements with the same tag keep their
+    original order. Raises ValueError for elements which are not allowed
+    in the container.
+
+    :container: Parent element
+    :child_elements: Child elements as a list
+    :order: The positions of the allowed tags as a dict
+    :text_elements: Text elements as a list of _TextElement tuples
+
+    """
+    slots = _ordered_slots(child_elements, order,
+                           ET.QName(container).localname, text_elements)
+    _append_slots(container, slots)
+
+
+def _ensure_sequence(value):
+    """
+    Return the value as it is if it is a list or a tuple, otherwise wrap
+    it in a tuple. Used for iterating over repeating elements, which
+    accept either a single value or a sequence of values, without
+    copying the sequences given by the caller.
+    """
+    if isinstance(value, (list, tuple)):
+        return value
+
+    return (value,)
+
+
 def _ensure_list(value):
     """
     Converts value if list if it isn't a list already. Used for
@@ -146,14 +368,8 @@ def mix(child_elements=None, namespaces=None):
         namespaces = NAMESPACES
 
     _mix = _element('mix', namespaces=namespaces)
-    _mix.set(
-        xsi_ns('schemaLocation'),
-        'http://www.loc.gov/mix/v20 '
-        'http://www.loc.gov/mix/mix.xsd')
-
-    if child_elements:
-        child_elements.sort(key=mix_root_order)
-        for element in child_elements:
-            _mix.append(element)
+    _mix.set(_SCHEMA_LOCATION_ATTR, _SCHEMA_LOCATION)
+
+    _append_ordered(_mix, child_elements, MIX_ROOT_ORDER)
 
     return _mix
@@ -14,17 +14,22 @@ References:
 
 """
 
-from nisomix.base import (_element, _ensure_list, _rationaltype_element,
-                          _subelement, mix_ns)
-from nisomix.constants import (CAMERA_SENSOR_TYPES, CAPTURE_DEVICE_TYPES,
-                               DIMENSION_UNITS, GPS_DATA_CONTENTS,
-                               IMAGE_DATA_CONTENTS, OPTICAL_RESOLUTION_UNITS,
-                               ORIENTATION_TYPES, SCANNER_SENSOR_TYPES)
-from nisomix.utils import (NAMESPACES, RestrictedElementError,
-                           camera_capture_order, camera_capture_settings_order,
-                           gps_data_order, image_capture_order,
-                           image_data_order, scanner_capture_order,
-                           source_information_order)
+from nisomix.base import (_append_ordered, _element, _ensure_sequence,
+                          _optional_subelements, _rationaltype_element,
+                          _subelement, _TextElement, _text_subelement,
+                          mix_ns)
+from nisomix.constants import (CAMERA_SENSOR_TYPES, CAMERA_SENSOR_TYPES_SET,
+                               CAPTURE_DEVICE_TYPES, CAPTURE_DEVICE_TYPES_SET,
+                               DIMENSION_UNITS, DIMENSION_UNITS_SET,
+                               GPS_DATA_CONTENTS, IMAGE_DATA_CONTENTS,
+                               OPTICAL_RESOLUTION_UNITS,
+                               OPTICAL_RESOLUTION_UNITS_SET, ORIENTATION_TYPES,
+                               ORIENTATION_TYPES_SET, SCANNER_SENSOR_TYPES,
+                               SCANNER_SENSOR_TYPES_SET)
+from nisomix.utils import (CAMERA_CAPTURE_ORDER, CAMERA_CAPTURE_SETTINGS_ORDER,
+                           GPS_DATA_ORDER, IMAGE_CAPTURE_ORDER,
+                           IMAGE_DATA_ORDER, NAMESPACES, SCANNER_CAPTURE_ORDER,
+                           SOURCE_INFORMATION_ORDER, RestrictedElementError)
 
 __all__ = ['image_capture_metadata', 'source_information', 'source_id',
            'source_size', 'capture_information', 'device_capture',
@@ -32,6 +37,77 @@ __all__ = ['image_capture_metadata', 'source_information', 'source_id',
            'camera_capture_settings', 'image_data', 'gps_data',
            'parse_datetime_created']
 
+# Tag prefixes of the scanner and digital camera specific elements by
+# the device type, in the forms used within a tag name and at the start
+# of a container tag name
+_DEVICE_PREFIXES = {'scanner': 'scanner',
+                    'camera': 'digitalCamera'}
+_CAPITALIZED_DEVICE_PREFIXES = {'scanner': 'Scanner',
+                                'camera': 'DigitalCamera'}
+
+# The dimension, value and unit tags of the X, Y and Z axes of the
+# source size
+_SOURCE_DIMENSIONS = tuple(
+    (f'Source{axis}Dimension', f'source{axis}DimensionValue',
+     f'source{axis}DimensionUnit') for axis in 'XYZ')
+
+# GPS coordinate group elements and the keys of their degrees, minutes
+# and seconds in the gps_data contents
+_GPS_GROUPS = (
+    ('GPSLatitude', 'lat_degrees', 'lat_minutes', 'lat_seconds'),
+    ('GPSLongitude', 'long_degrees', 'long_minutes', 'long_seconds'),
+    ('GPSDestLatitude', 'dest_lat_degrees', 'dest_lat_minutes',
+     'dest_lat_seconds'),
+    ('GPSDestLongitude', 'dest_long_degrees', 'dest_long_minutes',
+     'dest_long_seconds'))
+
+# Keys of the image_data and gps_data contents which are given as text
+# elements and as rational type elements, and the tags of the elements
+_IMAGE_DATA_TAGS = {
+    'fnumber': 'fNumber', 'exposure_time': 'exposureTime',
+    'exposure_program': 'exposureProgram',
+    'isospeed_ratings': 'isoSpeedRatings',
+    'exif_version': 'exifVersion',
+    'metering_mode': 'meteringMode',
+    'light_source': 'lightSource', 'flash': 'flash',
+    'focal_length': 'focalLength',
+    'back_light': 'backLight', 'exposure_index': 'exposureIndex',
+    'sensing_method': 'sensingMethod', 'cfa_pattern': 'cfaPattern',
+    'auto_focus': 'autoFocus'}
+
+_IMAGE_DATA_RATIONALS = {
+    'oecf': 'oECF', 'shutter_speed_value': 'shutterSpeedValue',
+    'aperture_value': 'apertureValue',
+    'brightness_value': 'brightnessValue',
+    'exposure_bias_value': 'exposureBiasValue',
+    'max_aperture_value': 'maxApertureValue',
+    'flash_energy': 'flashEnergy'}
+
+_GPS_DATA_TAGS = {
+    'version_id': 'gpsVersionID', 'lat_ref': 'gpsLatitudeRef',
+    'long_ref': 'gpsLongitudeRef',
+    'altitude_ref': 'gpsAltitudeRef',
+    'timestamp': 'gpsTimeStamp', 'satellites': 'gpsSatellites',
+    'status': 'gpsStatus',
+    'measure_mode': 'gpsMeasureMode',
+    'speed_ref': 'gpsSpeedRef',
+    'track_ref': 'gpsTrackRef',
+    'img_direction_ref': 'gpsImgDirectionRef',
+    'map_datum': 'gpsMapDatum',
+    'dest_lat_ref': 'gpsDestLatitudeRef',
+    'dest_long_ref': 'gpsDestLongitudeRef',
+    'dest_bearing_ref': 'gpsDestBearingRef',
+    'dest_distance_ref': 'gpsDestDistanceRef',
+    'processing_method': 'gpsProcessingMethod',
+    'area_information': 'gpsAreaInformation',
+    'datestamp': 'gpsDateStamp',
+    'differential': 'gpsDifferential'}
+
+_GPS_DATA_RATIONALS = {
+    'altitude': 'gpsAltitude', 'dop': 'gpsDOP', 'speed': 'gpsSpeed',
+    'track': 'gpsTrack', 'direction': 'gpsImgDirection',
+    'dest_bearing': 'gpsDestBearing', 'dest_distance': 'gpsDestDistance'}
+
 
 def image_capture_metadata(orientation=None, methodology=None,
                            child_elements=None):
@@ -51,28 +127,21 @@ def image_capture_metadata(orientation=None, methodology=None,
         </mix:ImageCaptureMetadata>
 
     """
-    if child_elements is None:
-        child_elements = []
-
-    container = _element('ImageCaptureMetadata')
+    text_elements = []
 
     if orientation:
-        if orientation in ORIENTATION_TYPES:
-            orientation_el = _element('orientation')
-            orientation_el.text = orientation
-            child_elements.append(orientation_el)
+        if orientation in ORIENTATION_TYPES_SET:
+            text_elements.append(
+                _TextElement(mix_ns('orientation'), orientation))
         else:
             raise RestrictedElementError(
                 orientation, 'orientation', ORIENTATION_TYPES)
     if methodology:
-        methodology_el = _element('methodology')
-        methodology_el.text = methodology
-        child_elements.append(methodology_el)
+        text_elements.append(_TextElement(mix_ns('methodology'), methodology))
 
-    child_elements.sort(key=image_capture_order)
-
-    for element in child_elements:
-        container.append(element)
+    container = _element('ImageCaptureMetadata')
+    _append_ordered(container, child_elements, IMAGE_CAPTURE_ORDER,
+                    text_elements)
 
     return container
 
@@ -93,19 +162,14 @@ def source_information(source_type=None, child_elements=None):
         </mix:SourceInformation>
 
     """
-    container = _element('SourceInformation')
-
-    if child_elements is None:
-        child_elements = []
+    text_elements = []
 
     if source_type:
-        source_type_el = _element('sourceType')
-        source_type_el.text = source_type
-        child_elements.append(source_type_el)
+        text_elements.append(_TextElement(mix_ns('sourceType'), source_type))
 
-    child_elements.sort(key=source_information_order)
-    for element in child_elements:
-        container.append(element)
+    container = _element('SourceInformation')
+    _append_ordered(container, child_elements, SOURCE_INFORMATION_ORDER,
+                    text_elements)
 
     return container
 
@@ -127,13 +191,8 @@ def source_id(source_idtype=None, source_idvalue=None):
     """
     container = _element('SourceID')
 
-    if source_idtype:
-        source_idtype_el = _subelement(container, 'sourceIDType')
-        source_idtype_el.text = source_idtype
-
-    if source_idvalue:
-        source_idvalue_el = _subelement(container, 'sourceIDValue')
-        source_idvalue_el.text = source_idvalue
+    _optional_subelements(container, (('sourceIDType', source_idtype),
+                                      ('sourceIDValue', source_idvalue)))
 
     return container
 
@@ -173,44 +232,20 @@ def source_size(x_value=None, x_unit=None, y_value=None, y_unit=None,
     """
     container = _element('SourceSize')
 
-    if x_value or x_unit:
-        x_dimension = _subelement(container, 'SourceXDimension')
-        if x_value:
-            x_value_el = _subelement(x_dimension, 'sourceXDimensionValue')
-            x_value_el.text = x_value
-        if x_unit:
-            if x_unit in DIMENSION_UNITS:
-                x_unit_el = _subelement(x_dimension, 'sourceXDimensionUnit')
-                x_unit_el.text = x_unit
-            else:
-                raise RestrictedElementError(
-                    x_unit, 'sourceXDimensionUnit', DIMENSION_UNITS)
-
-    if y_value or y_unit:
-        y_dimension = _subelement(container, 'SourceYDimension')
-        if y_value:
-            y_value_el = _subelement(y_dimension, 'sourceYDimensionValue')
-            y_value_el.text = y_value
-        if y_unit:
-            if y_unit in DIMENSION_UNITS:
-                y_unit_el = _subelement(y_dimension, 'sourceYDimensionUnit')
-                y_unit_el.text = y_unit
-            else:
-                raise RestrictedElementError(
-                    y_unit, 'sourceYDimensionUnit', DIMENSION_UNITS)
-
-    if z_value or z_unit:
-        z_dimension = _subelement(container, 'SourceZDimension')
-        if z_value:
-            z_value_el = _subelement(z_dimension, 'sourceZDimensionValue')
-            z_value_el.text = z_value
-        if z_unit:
-            if z_unit in DIMENSION_UNITS:
-                z_unit_el = _subelement(z_dimension, 'sourceZDimensionUnit')
-                z_unit_el.text = z_unit
+    axes = ((x_value, x_unit), (y_value, y_unit), (z_value, z_unit))
+    for (value, unit), (dimension_tag, value_tag, unit_tag) in zip(
+            axes, _SOURCE_DIMENSIONS):
+        if not (value or unit):
+            continue
+        dimension = _subelement(container, dimension_tag)
+        if value:
+            _text_subelement(dimension, value_tag, value)
+        if unit:
+            if unit in DIMENSION_UNITS_SET:
+                _text_subelement(dimension, unit_tag, unit)
             else:
                 raise RestrictedElementError(
-                    z_unit, 'sourceZDimensionUnit', DIMENSION_UNITS)
+                    unit, unit_tag, DIMENSION_UNITS)
 
     return container
 
@@ -235,19 +270,15 @@ def capture_information(created=None, producer=None, device=None):
     container = _element('GeneralCaptureInformation')
 
     if created:
-        created_el = _subelement(container, 'dateTimeCreated')
-        created_el.text = created
+        _text_subelement(container, 'dateTimeCreated', created)
 
     if producer:
-        producer = _ensure_list(producer)
-        for item in producer:
-            producer_el = _subelement(container, 'imageProducer')
-            producer_el.text = item
+        for item in _ensure_sequence(producer):
+            _text_subelement(container, 'imageProducer', item)
 
     if device:
-        if device in CAPTURE_DEVICE_TYPES:
-            device_el = _subelement(container, 'captureDevice')
-            device_el.text = device
+        if device in CAPTURE_DEVICE_TYPES_SET:
+            _text_subelement(container, 'captureDevice', device)
         else:
             raise RestrictedElementError(
                 device, 'captureDevice', CAPTURE_DEVICE_TYPES)
@@ -267,52 +298,41 @@ def device_capture(device_type, manufacturer=None, sensor=None,
     :child_elements: Child elements as a list
 
     """
-    prefixes = {'scanner': 'scanner',
-                'camera': 'digitalCamera'}
-
-    if device_type not in prefixes:
+    if device_type not in _DEVICE_PREFIXES:
         raise ValueError('Invalid value. Only "scanner" or "camera" are '
                          'valid device types.')
+    prefix = _DEVICE_PREFIXES[device_type]
 
-    if child_elements is None:
-        child_elements = []
-
-    container = _element(
-        'capture',
-        prefix=prefixes[device_type][0].capitalize()
-        + prefixes[device_type][1:])
+    text_elements = []
 
     if manufacturer:
-        manufacturer_el = _element('manufacturer',
-                                   prefix=prefixes[device_type])
-        manufacturer_el.text = manufacturer
-        child_elements.append(manufacturer_el)
+        text_elements.append(
+            _TextElement(mix_ns('manufacturer', prefix), manufacturer))
 
     if sensor and device_type == 'scanner':
-        if sensor in SCANNER_SENSOR_TYPES:
-            sensor_el = _element('scannerSensor')
-            sensor_el.text = sensor
-            child_elements.append(sensor_el)
+        if sensor in SCANNER_SENSOR_TYPES_SET:
+            text_elements.append(
+                _TextElement(mix_ns('scannerSensor'), sensor))
         else:
             raise RestrictedElementError(
                 sensor, 'scannerSensor', SCANNER_SENSOR_TYPES)
 
     if sensor and device_type == 'camera':
-        if sensor in CAMERA_SENSOR_TYPES:
-            sensor_el = _element('cameraSensor')
-            sensor_el.text = sensor
-            child_elements.append(sensor_el)
+        if sensor in CAMERA_SENSOR_TYPES_SET:
+            text_elements.append(
+                _TextElement(mix_ns('cameraSensor'), sensor))
         else:
             raise RestrictedElementError(
                 sensor, 'cameraSensor', CAMERA_SENSOR_TYPES)
 
-    if device_type == 'scanner':
-        child_elements.sort(key=scanner_capture_order)
-    if device_type == 'camera':
-        child_elements.sort(key=camera_capture_order)
+    container = _element(
+        'capture', prefix=_CAPITALIZED_DEVICE_PREFIXES[device_type])
 
-    for element in child_elements:
-        container.append(element)
+    if device_type == 'scanner':
+        order = SCANNER_CAPTURE_ORDER
+    else:
+        order = CAMERA_CAPTURE_ORDER
+    _append_ordered(container, child_elements, order, text_elements)
 
     return container
 
@@ -329,32 +349,18 @@ def device_model(device_type, name=None, number=None,
     :serialno: The serial number of the capture device as a string
 
     """
-    prefixes = {'scanner': 'scanner',
-                'camera': 'digitalCamera'}
-
-    if device_type not in prefixes:
+    if device_type not in _DEVICE_PREFIXES:
         raise ValueError('Invalid value. Only "scanner" or "camera" are '
                          'valid device types.')
+    prefix = _DEVICE_PREFIXES[device_type]
 
     container = _element(
-        'model',
-        prefix=prefixes[device_type][0].capitalize()
-        + prefixes[device_type][1:])
+        'model', prefix=_CAPITALIZED_DEVICE_PREFIXES[device_type])
 
-    if name:
-        device_name_el = _subelement(container, 'modelName',
-                                     prefix=prefixes[device_type])
-        device_name_el.text = name
-
-    if number:
-        device_number_el = _subelement(container, 'modelNumber',
-                                       prefix=prefixes[device_type])
-        device_number_el.text = number
-
-    if serialno:
-        device_serialno_el = _subelement(container, 'modelSerialNo',
-                                         prefix=prefixes[device_type])
-        device_serialno_el.text = serialno
+    _optional_subelements(container, (('modelName', name),
+                                      ('modelNumber', number),
+                                      ('modelSerialNo', serialno)),
+                          prefix=prefix)
 
     return container
 
@@ -378,18 +384,12 @@ def max_optical_resolution(x_resolution=None, y_resolution=None, unit=None):
     """
     container = _element('MaximumOpticalResolution')
 
-    if x_resolution:
-        x_resolution_el = _subelement(container, 'xOpticalResolution')
-        x_resolution_el.text = str(x_resolution)
-
-    if y_resolution:
-        y_resolution_el = _subelement(container, 'yOpticalResolution')
-        y_resolution_el.text = str(y_resolution)
+    _optional_subelements(container, (('xOpticalResolution', x_resolution),
+                                      ('yOpticalResolution', y_resolution)))
 
     if unit:
-        if unit in OPTICAL_RESOLUTION_UNITS:
-            unit_el = _subelement(container, 'opticalResolutionUnit')
-            unit_el.text = unit
+        if unit in OPTICAL_RESOLUTION_UNITS_SET:
+            _text_subelement(container, 'opticalResolutionUnit', unit)
         else:
             raise RestrictedElementError(
                 unit, 'opticalResolutionUnit', OPTICAL_RESOLUTION_UNITS)
@@ -414,13 +414,8 @@ def scanning_software(name=None, version=None):
     """
     container = _element('ScanningSystemSoftware')
 
-    if name:
-        name_el = _subelement(container, 'scanningSoftwareName')
-        name_el.text = name
-
-    if version:
-        version_el = _subelement(container, 'scanningSoftwareVersionNo')
-        version_el.text = version
+    _optional_subelements(container, (('scanningSoftwareName', name),
+                                      ('scanningSoftwareVersionNo', version)))
 
     return container
 
@@ -439,12 +434,7 @@ def camera_capture_settings(child_elements=None):
 
     """
     container = _element('CameraCaptureSettings')
-
-    if child_elements:
-        child_elements.sort(key=camera_capture_settings_order)
-
-        for element in child_elements:
-            container.append(element)
+    _append_ordered(container, child_elements, CAMERA_CAPTURE_SETTINGS_ORDER)
 
     return container
 
@@ -485,81 +475,55 @@ def image_data(contents=None):
                     "y_print_aspect_ratio": None}
 
     """
-    tags = {
-        'fnumber': 'fNumber', 'exposure_time': 'exposureTime',
-        'exposure_program': 'exposureProgram',
-        'isospeed_ratings': 'isoSpeedRatings',
-        'exif_version': 'exifVersion',
-        'metering_mode': 'meteringMode',
-        'light_source': 'lightSource', 'flash': 'flash',
-        'focal_length': 'focalLength',
-        'back_light': 'backLight', 'exposure_index': 'exposureIndex',
-        'sensing_method': 'sensingMethod', 'cfa_pattern': 'cfaPattern',
-        'auto_focus': 'autoFocus'}
-
-    rationals = {'oecf': 'oECF', 'shutter_speed_value': 'shutterSpeedValue',
-                 'aperture_value': 'apertureValue',
-                 'brightness_value': 'brightnessValue',
-                 'exposure_bias_value': 'exposureBiasValue',
-                 'max_aperture_value': 'maxApertureValue',
-                 'flash_energy': 'flashEnergy'}
-
-    for key in contents:
-        if key not in IMAGE_DATA_CONTENTS:
-            raise ValueError('Key "%s" not in supported keys for '
-                             'image_data.' % key)
-
     container = _element('ImageData')
     child_elements = []
+    text_elements = []
 
     for key, value in contents.items():
-        if key in tags and value:
-            elem = _element(tags[key])
-            elem.text = str(value)
-            child_elements.append(elem)
-
-        if key in rationals and value:
-            elem = _rationaltype_element(rationals[key], value)
+        if key not in IMAGE_DATA_CONTENTS:
+            raise ValueError(f'Key "{key}" not in supported keys for '
+                             'image_data.')
+        if not value:
+            continue
+
+        if key in _IMAGE_DATA_TAGS:
+            tag = mix_ns(_IMAGE_DATA_TAGS[key])
+            text_elements.append(_TextElement(tag, str(value)))
+        elif key in _IMAGE_DATA_RATIONALS:
+            elem = _rationaltype_element(_IMAGE_DATA_RATIONALS[key], value)
             child_elements.append(elem)
-
-    if contents.get("spectral_sensitivity"):
-        spect_sens = _ensure_list(contents["spectral_sensitivity"])
-        for item in spect_sens:
-            spect_sens_el = _element('spectralSensitivity')
-            spect_sens_el.text = item
-            child_elements.append(spect_sens_el)
-
-    if contents.get("distance") or contents.get("min_distance") \
-            or contents.get("max_distance"):
+        elif key == 'spectral_sensitivity':
+            tag = mix_ns('spectralSensitivity')
+            for item in _ensure_sequence(value):
+                text_elements.append(_TextElement(tag, item))
+
+    distance = contents.get('distance')
+    min_distance = contents.get('min_distance')
+    max_distance = contents.get('max_distance')
+    if distance or min_distance or max_distance:
         subject_distance = _element('SubjectDistance')
         child_elements.append(subject_distance)
-    if contents.get("distance"):
-        distance_el = _subelement(subject_distance, 'distance')
-        distance_el.text = contents["distance"]
-    if contents.get("min_distance") or contents.get("max_distance"):
-        min_max_distance = _subelement(subject_distance, 'MinMaxDistance')
-    if contents.get("min_distance"):
-        min_distance_el = _subelement(min_max_distance, 'minDistance')
-        min_distance_el.text = contents["min_distance"]
-    if contents.get("max_distance"):
-        max_distance_el = _subelement(min_max_distance, 'maxDistance')
-        max_distance_el.text = contents["max_distance"]
-
-    if contents.get("x_print_aspect_ratio") or \
-            contents.get("y_print_aspect_ratio"):
+        if distance:
+            _text_subelement(subject_distance, 'distance', distance)
+        if min_distance or max_distance:
+            min_max_distance = _subelement(subject_distance, 'MinMaxDistance')
+            if min_distance:
+                _text_subelement(min_max_distance, 'minDistance', min_distance)
+            if max_distance:
+                _text_subelement(min_max_distance, 'maxDistance', max_distance)
+
+    x_print_ratio = contents.get('x_print_aspect_ratio')
+    y_print_ratio = contents.get('y_print_aspect_ratio')
+    if x_print_ratio or y_print_ratio:
         print_ratio = _element('PrintAspectRatio')
         child_elements.append(print_ratio)
-    if contents.get("x_print_aspect_ratio"):
-        x_print_aspect_ratio_el = _subelement(print_ratio, 'xPrintAspectRatio')
-        x_print_aspect_ratio_el.text = contents["x_print_aspect_ratio"]
-    if contents.get("y_print_aspect_ratio"):
-        y_print_aspect_ratio_el = _subelement(print_ratio, 'yPrintAspectRatio')
-        y_print_aspect_ratio_el.text = contents["y_print_aspect_ratio"]
+        if x_print_ratio:
+            _text_subelement(print_ratio, 'xPrintAspectRatio', x_print_ratio)
+        if y_print_ratio:
+            _text_subelement(print_ratio, 'yPrintAspectRatio', y_print_ratio)
 
-    child_elements.sort(key=image_data_order)
-
-    for element in child_elements:
-        container.append(element)
+    _append_ordered(container, child_elements, IMAGE_DATA_ORDER,
+                    text_elements)
 
     return container
 
@@ -613,88 +577,34 @@ def gps_data(contents=None):
                     "gps_groups": None}
 
     """
-    tags = {'version_id': 'gpsVersionID', 'lat_ref': 'gpsLatitudeRef',
-            'long_ref': 'gpsLongitudeRef',
-            'altitude_ref': 'gpsAltitudeRef',
-            'timestamp': 'gpsTimeStamp', 'satellites': 'gpsSatellites',
-            'status': 'gpsStatus',
-            'measure_mode': 'gpsMeasureMode',
-            'speed_ref': 'gpsSpeedRef',
-            'track_ref': 'gpsTrackRef',
-            'img_direction_ref': 'gpsImgDirectionRef',
-            'map_datum': 'gpsMapDatum',
-            'dest_lat_ref': 'gpsDestLatitudeRef',
-            'dest_long_ref': 'gpsDestLongitudeRef',
-            'dest_bearing_ref': 'gpsDestBearingRef',
-            'dest_distance_ref': 'gpsDestDistanceRef',
-            'processing_method': 'gpsProcessingMethod',
-            'area_information': 'gpsAreaInformation',
-            'datestamp': 'gpsDateStamp',
-            'differential': 'gpsDifferential'}
-
-    rationals = {'altitude': 'gpsAltitude',
-                 'dop': 'gpsDOP',
-                 'speed': 'gpsSpeed',
-                 'track': 'gpsTrack',
-                 'direction': 'gpsImgDirection',
-                 'dest_bearing': 'gpsDestBearing',
-                 'dest_distance': 'gpsDestDistance'}
-
-    for key in contents:
-        if key not in GPS_DATA_CONTENTS:
-            raise ValueError('Key "%s" not in supported keys '
-                             'for gps_data.' % key)
-
     container = _element('GPSData')
     child_elements = []
+    text_elements = []
 
     for key, value in contents.items():
-        if key in tags and value:
-            elem = _element(tags[key])
-            elem.text = value
+        if key not in GPS_DATA_CONTENTS:
+            raise ValueError(f'Key "{key}" not in supported keys '
+                             'for gps_data.')
+        if not value:
+            continue
+
+        if key in _GPS_DATA_TAGS:
+            tag = mix_ns(_GPS_DATA_TAGS[key])
+            text_elements.append(_TextElement(tag, value))
+        elif key in _GPS_DATA_RATIONALS:
+            elem = _rationaltype_element(_GPS_DATA_RATIONALS[key], value)
             child_elements.append(elem)
 
-        if key in rationals and value:
-            elem = _rationaltype_element(rationals[key], value)
-            child_elements.append(elem)
+    for tag, degrees_key, minutes_key, seconds_key in _GPS_GROUPS:
+        degrees = contents.get(degrees_key)
+        minutes = contents.get(minutes_key)
+        seconds = contents.get(seconds_key)
+        if degrees or minutes or seconds:
+            child_elements.append(_gps_group(tag, degrees=degrees,
+                                             minutes=minutes,
+                                             seconds=seconds))
 
-    if contents.get("lat_degrees") or contents.get("lat_minutes") or \
-            contents.get("lat_seconds"):
-        lat_group = _gps_group('GPSLatitude', degrees=contents["lat_degrees"],
-                               minutes=contents["lat_minutes"],
-                               seconds=contents["lat_seconds"])
-        child_elements.append(lat_group)
-
-    if contents.get("long_degrees") or contents.get("long_minutes") or \
-            contents.get("long_seconds"):
-        long_group = _gps_group('GPSLongitude',
-                                degrees=contents["long_degrees"],
-                                minutes=contents["long_minutes"],
-                                seconds=contents["long_seconds"])
-        child_elements.append(long_group)
-
-    if contents.get("dest_lat_degrees") or \
-            contents.get("dest_lat_minutes") or \
-            contents.get("dest_lat_seconds"):
-        dest_lat_group = _gps_group('GPSDestLatitude',
-                                    degrees=contents["dest_lat_degrees"],
-                                    minutes=contents["dest_lat_minutes"],
-                                    seconds=contents["dest_lat_seconds"])
-        child_elements.append(dest_lat_group)
-
-    if contents.get("dest_long_degrees") or \
-            contents.get("dest_long_minutes") or \
-            contents.get("dest_long_seconds"):
-        dest_long_group = _gps_group('GPSDestLongitude',
-                                     degrees=contents["dest_long_degrees"],
-                                     minutes=contents["dest_long_minutes"],
-                                     seconds=contents["dest_long_seconds"])
-        child_elements.append(dest_long_group)
-
-    child_elements.sort(key=gps_data_order)
-
-    for element in child_elements:
-        container.append(element)
+    _append_ordered(container, child_elements, GPS_DATA_ORDER, text_elements)
 
     return container
 
@@ -728,17 +638,10 @@ def _gps_group(tag, degrees=None, minutes=None, seconds=None):
     """
     container = _element(tag)
 
-    if degrees:
-        degrees_el = _rationaltype_element('degrees', degrees)
-        container.append(degrees_el)
-
-    if minutes:
-        minutes_el = _rationaltype_element('minutes', minutes)
-        container.append(minutes_el)
-
-    if seconds:
-        seconds_el = _rationaltype_element('seconds', seconds)
-        container.append(seconds_el)
+    for part, value in (('degrees', degrees), ('minutes', minutes),
+                        ('seconds', seconds)):
+        if value:
+            _rationaltype_element(part, value, parent=container)
 
     return container
 
@@ -753,11 +656,14 @@ def parse_datetime_created(elem):
     """
     created = None
 
-    if elem.tag != (mix_ns, 'dateTimeCreated'):
-        elem = elem.xpath('//mix:dateTimeCreated', namespaces=NAMESPACES)[0]
+    if elem.tag != mix_ns('dateTimeCreated'):
+        try:
+            elem = elem.xpath('//mix:dateTimeCreated',
+                              namespaces=NAMESPACES)[0]
+        except IndexError:
+            return None
 
-    if elem is not None:
-        if elem.text:
-            created = elem.text
+    if elem.text:
+        created = elem.text
 
     return created
@@ -13,10 +13,10 @@ References:
 
 """
 
-from nisomix.base import _element, _ensure_list, _subelement
-from nisomix.utils import (change_history_order,
-                           image_processing_order,
-                           mix_root_order)
+from nisomix.base import (_append_ordered, _element, _ensure_sequence,
+                          _TextElement, _text_subelement, mix_ns)
+from nisomix.utils import (CHANGE_HISTORY_ORDER, IMAGE_PROCESSING_ORDER,
+                           MIX_ROOT_ORDER)
 
 __all__ = ['change_history',
            'image_processing',
@@ -40,11 +40,7 @@ def change_history(child_elements=None):
 
     """
     container = _element('ChangeHistory')
-    if child_elements:
-        child_elements.sort(key=change_history_order)
-
-        for element in child_elements:
-            container.append(element)
+    _append_ordered(container, child_elements, CHANGE_HISTORY_ORDER)
 
     return container
 
@@ -74,44 +70,32 @@ def image_processing(datetime=None, source_data=None, agencies=None,
         </mix:ImageProcessing>
 
     """
-    container = _element('ImageProcessing')
-
-    if child_elements is None:
-        child_elements = []
+    text_elements = []
 
     if datetime:
-        datetime_el = _element('dateTimeProcessed')
-        datetime_el.text = datetime
-        child_elements.append(datetime_el)
+        text_elements.append(
+            _TextElement(mix_ns('dateTimeProcessed'), datetime))
 
     if source_data:
-        source_data_el = _element('sourceData')
-        source_data_el.text = source_data
-        child_elements.append(source_data_el)
+        text_elements.append(_TextElement(mix_ns('sourceData'), source_data))
 
     if agencies:
-        agencies = _ensure_list(agencies)
-        for item in agencies:
-            agency_el = _element('processingAgency')
-            agency_el.text = item
-            child_elements.append(agency_el)
+        tag = mix_ns('processingAgency')
+        for item in _ensure_sequence(agencies):
+            text_elements.append(_TextElement(tag, item))
 
     if rationale:
-        rationale_el = _element('processingRationale')
-        rationale_el.text = rationale
-        child_elements.append(rationale_el)
+        text_elements.append(
+            _TextElement(mix_ns('processingRationale'), rationale))
 
     if actions:
-        actions = _ensure_list(actions)
-        for item in actions:
-            action_el = _element('processingActions')
-            action_el.text = item
-            child_elements.append(action_el)
-
-    child_elements.sort(key=image_processing_order)
+        tag = mix_ns('processingActions')
+        for item in _ensure_sequence(actions):
+            text_elements.append(_TextElement(tag, item))
 
-    for element in child_elements:
-        container.append(element)
+    container = _element('ImageProcessing')
+    _append_ordered(container, child_elements, IMAGE_PROCESSING_ORDER,
+                    text_elements)
 
     return container
 
@@ -147,21 +131,17 @@ def processing_software(name=None, version=None, os_name=None,
     container = _element('ProcessingSoftware')
 
     if name:
-        name_el = _subelement(container, 'processingSoftwareName')
-        name_el.text = name
+        _text_subelement(container, 'processingSoftwareName', name)
 
     if version:
-        version_el = _subelement(container, 'processingSoftwareVersion')
-        version_el.text = version
+        _text_subelement(container, 'processingSoftwareVersion', version)
 
     if os_name:
-        os_name_el = _subelement(container, 'processingOperatingSystemName')
-        os_name_el.text = os_name
+        _text_subelement(container, 'processingOperatingSystemName', os_name)
 
     if os_version:
-        os_version_el = _subelement(container,
-                                    'processingOperatingSystemVersion')
-        os_version_el.text = os_version
+        _text_subelement(
+            container, 'processingOperatingSystemVersion', os_version)
 
     return container
 
@@ -180,13 +160,6 @@ def previous_image_metadata(child_elements=None):
 
     """
     container = _element('PreviousImageMetadata')
-
-    if child_elements is None:
-        child_elements = []
-
-    child_elements.sort(key=mix_root_order)
-
-    for element in child_elements:
-        container.append(element)
+    _append_ordered(container, child_elements, MIX_ROOT_ORDER)
 
     return container
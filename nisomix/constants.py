@@ -73,6 +73,28 @@ GRAY_RESPONSE_UNITS = ['Number represents tenths of a unit',
 
 TARGET_TYPES = ['external', 'internal']
 
+# Sets of the accepted values for fast membership tests. The lists above
+# keep the documented order for error messages.
+BYTE_ORDER_TYPES_SET = frozenset(BYTE_ORDER_TYPES)
+DIGEST_ALGORITHMS_SET = frozenset(DIGEST_ALGORITHMS)
+YCBCR_SUBSAMPLE_TYPES_SET = frozenset(YCBCR_SUBSAMPLE_TYPES)
+YCBCR_POSITIONING_TYPES_SET = frozenset(YCBCR_POSITIONING_TYPES)
+COMPONENT_INTERPRETATION_TYPES_SET = frozenset(
+    COMPONENT_INTERPRETATION_TYPES)
+DJVU_FORMATS_SET = frozenset(DJVU_FORMATS)
+ORIENTATION_TYPES_SET = frozenset(ORIENTATION_TYPES)
+DIMENSION_UNITS_SET = frozenset(DIMENSION_UNITS)
+OPTICAL_RESOLUTION_UNITS_SET = frozenset(OPTICAL_RESOLUTION_UNITS)
+CAPTURE_DEVICE_TYPES_SET = frozenset(CAPTURE_DEVICE_TYPES)
+SCANNER_SENSOR_TYPES_SET = frozenset(SCANNER_SENSOR_TYPES)
+CAMERA_SENSOR_TYPES_SET = frozenset(CAMERA_SENSOR_TYPES)
+SAMPLING_FREQUENCY_PLANES_SET = frozenset(SAMPLING_FREQUENCY_PLANES)
+SAMPLING_FREQUENCY_UNITS_SET = frozenset(SAMPLING_FREQUENCY_UNITS)
+BITS_PER_SAMPLE_UNITS_SET = frozenset(BITS_PER_SAMPLE_UNITS)
+EXTRA_SAMPLES_TYPES_SET = frozenset(EXTRA_SAMPLES_TYPES)
+GRAY_RESPONSE_UNITS_SET = frozenset(GRAY_RESPONSE_UNITS)
+TARGET_TYPES_SET = frozenset(TARGET_TYPES)
+
 IMAGE_DATA_CONTENTS = {'fnumber': None,
                        'exposure_time': None,
                        'exposure_program': None,
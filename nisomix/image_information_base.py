@@ -13,12 +13,17 @@ References:
 
 """
 
-from nisomix.base import _element, _subelement, _rationaltype_element
-from nisomix.constants import (DJVU_FORMATS, YCBCR_SUBSAMPLE_TYPES,
+from nisomix.base import (_append_ordered, _element, _subelement,
+                          _rationaltype_element, _text_subelement)
+from nisomix.constants import (DJVU_FORMATS, DJVU_FORMATS_SET,
+                               YCBCR_SUBSAMPLE_TYPES,
+                               YCBCR_SUBSAMPLE_TYPES_SET,
                                YCBCR_POSITIONING_TYPES,
-                               COMPONENT_INTERPRETATION_TYPES)
-from nisomix.utils import (RestrictedElementError, image_information_order,
-                           photom_interpret_order)
+                               YCBCR_POSITIONING_TYPES_SET,
+                               COMPONENT_INTERPRETATION_TYPES,
+                               COMPONENT_INTERPRETATION_TYPES_SET)
+from nisomix.utils import (IMAGE_INFORMATION_ORDER, PHOTOM_INTERPRET_ORDER,
+                           RestrictedElementError)
 
 
 __all__ = ['image_information', 'image_characteristics',
@@ -44,12 +49,7 @@ def image_information(child_elements=None):
 
     """
     container = _element('BasicImageInformation')
-
-    if child_elements:
-        child_elements.sort(key=image_information_order)
-
-        for element in child_elements:
-            container.append(element)
+    _append_ordered(container, child_elements, IMAGE_INFORMATION_ORDER)
 
     return container
 
@@ -75,11 +75,9 @@ def image_characteristics(width=None, height=None,
     container = _element('BasicImageCharacteristics')
 
     if width:
-        width_el = _subelement(container, 'imageWidth')
-        width_el.text = str(width)
+        _text_subelement(container, 'imageWidth', str(width))
     if height:
-        height_el = _subelement(container, 'imageHeight')
-        height_el.text = str(height)
+        _text_subelement(container, 'imageHeight', str(height))
     if child_elements:
         for element in child_elements:
             container.append(element)
@@ -107,12 +105,8 @@ def photometric_interpretation(color_space=None, child_elements=None):
     container = _element('PhotometricInterpretation')
 
     if color_space:
-        color_space_el = _subelement(container, 'colorSpace')
-        color_space_el.text = color_space
-    if child_elements:
-        child_elements.sort(key=photom_interpret_order)
-        for element in child_elements:
-            container.append(element)
+        _text_subelement(container, 'colorSpace', color_space)
+    _append_ordered(container, child_elements, PHOTOM_INTERPRET_ORDER)
 
     return container
 
@@ -153,27 +147,21 @@ def color_profile(icc_name=None, icc_version=None, icc_uri=None,
     if icc_name or icc_version or icc_uri:
         icc_container = _subelement(container, 'IccProfile')
         if icc_name:
-            icc_name_el = _subelement(icc_container, 'iccProfileName')
-            icc_name_el.text = icc_name
+            _text_subelement(icc_container, 'iccProfileName', icc_name)
         if icc_version:
-            icc_version_el = _subelement(icc_container, 'iccProfileVersion')
-            icc_version_el.text = icc_version
+            _text_subelement(icc_container, 'iccProfileVersion', icc_version)
         if icc_uri:
-            icc_uri_el = _subelement(icc_container, 'iccProfileURI')
-            icc_uri_el.text = icc_uri
+            _text_subelement(icc_container, 'iccProfileURI', icc_uri)
 
     if local_name or local_url:
         local_container = _subelement(container, 'LocalProfile')
         if local_name:
-            local_name_el = _subelement(local_container, 'localProfileName')
-            local_name_el.text = local_name
+            _text_subelement(local_container, 'localProfileName', local_name)
         if local_url:
-            local_url_el = _subelement(local_container, 'localProfileURL')
-            local_url_el.text = local_url
+            _text_subelement(local_container, 'localProfileURL', local_url)
 
     if embedded_profile:
-        embedded_profile_el = _subelement(container, 'embeddedProfile')
-        embedded_profile_el.text = str(embedded_profile)
+        _text_subelement(container, 'embeddedProfile', str(embedded_profile))
 
     return container
 
@@ -221,28 +209,25 @@ def ycbcr(subsample_horiz=None, subsample_vert=None, positioning=None,
     if subsample_horiz or subsample_vert:
         subsample_container = _subelement(container, 'YCbCrSubSampling')
         if subsample_horiz:
-            if subsample_horiz in YCBCR_SUBSAMPLE_TYPES:
-                subsample_horiz_el = _subelement(
-                    subsample_container, 'yCbCrSubsampleHoriz')
-                subsample_horiz_el.text = subsample_horiz
+            if subsample_horiz in YCBCR_SUBSAMPLE_TYPES_SET:
+                _text_subelement(subsample_container, 'yCbCrSubsampleHoriz',
+                                 subsample_horiz)
             else:
                 raise RestrictedElementError(
                     subsample_horiz, 'yCbCrSubsampleHoriz',
                     YCBCR_SUBSAMPLE_TYPES)
         if subsample_vert:
-            if subsample_vert in YCBCR_SUBSAMPLE_TYPES:
-                subsample_vert_el = _subelement(
-                    subsample_container, 'yCbCrSubsampleVert')
-                subsample_vert_el.text = subsample_vert
+            if subsample_vert in YCBCR_SUBSAMPLE_TYPES_SET:
+                _text_subelement(
+                    subsample_container, 'yCbCrSubsampleVert', subsample_vert)
             else:
                 raise RestrictedElementError(
                     subsample_vert, 'yCbCrSubsampleVert',
                     YCBCR_SUBSAMPLE_TYPES)
 
     if positioning:
-        if positioning in YCBCR_POSITIONING_TYPES:
-            positioning_el = _subelement(container, 'yCbCrPositioning')
-            positioning_el.text = positioning
+        if positioning in YCBCR_POSITIONING_TYPES_SET:
+            _text_subelement(container, 'yCbCrPositioning', positioning)
         else:
             raise RestrictedElementError(
                 positioning, 'yCbCrPositioning', YCBCR_POSITIONING_TYPES)
@@ -312,10 +297,9 @@ def component(c_photometric_interpretation=None, footroom=None,
     container = _element('Component')
 
     if c_photometric_interpretation:
-        if c_photometric_interpretation in COMPONENT_INTERPRETATION_TYPES:
-            cpi_el = _subelement(
-                container, 'componentPhotometricInterpretation')
-            cpi_el.text = c_photometric_interpretation
+        if c_photometric_interpretation in COMPONENT_INTERPRETATION_TYPES_SET:
+            _text_subelement(container, 'componentPhotometricInterpretation',
+                             c_photometric_interpretation)
         else:
             raise RestrictedElementError(
                 c_photometric_interpretation,
@@ -397,42 +381,34 @@ def jpeg2000(codec=None, codec_version=None, codestream_profile=None,
     if codec or codec_version or codestream_profile or compliance_class:
         codec_container = _subelement(container, 'CodecCompliance')
         if codec:
-            codec_el = _subelement(codec_container, 'codec')
-            codec_el.text = codec
+            _text_subelement(codec_container, 'codec', codec)
         if codec_version:
-            codec_version_el = _subelement(codec_container, 'codecVersion')
-            codec_version_el.text = codec_version
+            _text_subelement(codec_container, 'codecVersion', codec_version)
         if codestream_profile:
-            codestream_profile_el = _subelement(
-                codec_container, 'codestreamProfile')
-            codestream_profile_el.text = codestream_profile
+            _text_subelement(
+                codec_container, 'codestreamProfile', codestream_profile)
         if compliance_class:
-            compliance_class_el = _subelement(
-                codec_container, 'complianceClass')
-            compliance_class_el.text = compliance_class
+            _text_subelement(
+                codec_container, 'complianceClass', compliance_class)
 
     tiles_container = None
     if tile_width or tile_height:
         tiles_container = _element('Tiles')
         if tile_width:
-            tile_width_el = _subelement(tiles_container, 'tileWidth')
-            tile_width_el.text = str(tile_width)
+            _text_subelement(tiles_container, 'tileWidth', str(tile_width))
         if tile_height:
-            tile_height_el = _subelement(tiles_container, 'tileHeight')
-            tile_height_el.text = str(tile_height)
+            _text_subelement(tiles_container, 'tileHeight', str(tile_height))
 
     if tiles_container is not None or quality_layers or resolution_levels:
         encoding_options = _subelement(container, 'EncodingOptions')
         if tiles_container is not None:
             encoding_options.append(tiles_container)
         if quality_layers:
-            quality_layers_el = _subelement(
-                encoding_options, 'qualityLayers')
-            quality_layers_el.text = str(quality_layers)
+            _text_subelement(
+                encoding_options, 'qualityLayers', str(quality_layers))
         if resolution_levels:
-            resolution_levels_el = _subelement(
-                encoding_options, 'resolutionLevels')
-            resolution_levels_el.text = str(resolution_levels)
+            _text_subelement(
+                encoding_options, 'resolutionLevels', str(resolution_levels))
 
     return container
 
@@ -453,8 +429,7 @@ def mrsid(zoom_levels=None):
     container = _element('MrSID')
 
     if zoom_levels:
-        zoom_levels_el = _subelement(container, 'zoomLevels')
-        zoom_levels_el.text = str(zoom_levels)
+        _text_subelement(container, 'zoomLevels', str(zoom_levels))
 
     return container
 
@@ -476,9 +451,8 @@ def djvu(djvu_format=None):
     container = _element('Djvu')
 
     if djvu_format:
-        if djvu_format in DJVU_FORMATS:
-            djvu_format_el = _subelement(container, 'djvuFormat')
-            djvu_format_el.text = djvu_format
+        if djvu_format in DJVU_FORMATS_SET:
+            _text_subelement(container, 'djvuFormat', djvu_format)
         else:
             raise RestrictedElementError(
                 djvu_format, 'djvuFormat', DJVU_FORMATS)
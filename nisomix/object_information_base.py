@@ -14,9 +14,11 @@ References:
 
 """
 
-from nisomix.base import _element, _rationaltype_element, _subelement, mix_ns
-from nisomix.constants import BYTE_ORDER_TYPES, DIGEST_ALGORITHMS
-from nisomix.utils import NAMESPACES, RestrictedElementError, basic_do_order
+from nisomix.base import (_append_ordered, _element, _rationaltype_element,
+                          _TextElement, _text_subelement, mix_ns)
+from nisomix.constants import (BYTE_ORDER_TYPES, BYTE_ORDER_TYPES_SET,
+                               DIGEST_ALGORITHMS, DIGEST_ALGORITHMS_SET)
+from nisomix.utils import BASIC_DO_ORDER, NAMESPACES, RestrictedElementError
 
 __all__ = ['digital_object_information', 'identifier', 'format_designation',
            'format_registry', 'compression', 'fixity',
@@ -47,24 +49,16 @@ def digital_object_information(byte_order=None, file_size=None,
         </mix:BasicDigitalObjectInformation>
 
     """
-    if child_elements is None:
-        child_elements = []
-
-    container = _element('BasicDigitalObjectInformation')
+    text_elements = []
 
     if file_size:
-        file_size_el = _element('fileSize')
-        file_size_el.text = str(file_size)
-        child_elements.append(file_size_el)
+        text_elements.append(_TextElement(mix_ns('fileSize'), str(file_size)))
     if byte_order:
-        byte_order_el = _element('byteOrder')
-        byte_order_el.text = _normalized_byteorder(byte_order)
-        child_elements.append(byte_order_el)
+        text_elements.append(_TextElement(
+            mix_ns('byteOrder'), _normalized_byteorder(byte_order)))
 
-    child_elements.sort(key=basic_do_order)
-
-    for element in child_elements:
-        container.append(element)
+    container = _element('BasicDigitalObjectInformation')
+    _append_ordered(container, child_elements, BASIC_DO_ORDER, text_elements)
 
     return container
 
@@ -87,12 +81,10 @@ def identifier(id_type=None, id_value=None):
     container = _element('ObjectIdentifier')
 
     if id_type:
-        id_type_el = _subelement(container, 'objectIdentifierType')
-        id_type_el.text = id_type
+        _text_subelement(container, 'objectIdentifierType', id_type)
 
     if id_value:
-        id_value_el = _subelement(container, 'objectIdentifierValue')
-        id_value_el.text = id_value
+        _text_subelement(container, 'objectIdentifierValue', id_value)
 
     return container
 
@@ -115,12 +107,10 @@ def format_designation(format_name=None, format_version=None):
     container = _element('FormatDesignation')
 
     if format_name:
-        format_name_el = _subelement(container, 'formatName')
-        format_name_el.text = format_name
+        _text_subelement(container, 'formatName', format_name)
 
     if format_version:
-        format_version_el = _subelement(container, 'formatVersion')
-        format_version_el.text = format_version
+        _text_subelement(container, 'formatVersion', format_version)
 
     return container
 
@@ -143,12 +133,10 @@ def format_registry(registry_name=None, registry_key=None):
     container = _element('FormatRegistry')
 
     if registry_name:
-        registry_name_el = _subelement(container, 'formatRegistryName')
-        registry_name_el.text = registry_name
+        _text_subelement(container, 'formatRegistryName', registry_name)
 
     if registry_key:
-        registry_key_el = _subelement(container, 'formatRegistryKey')
-        registry_key_el.text = registry_key
+        _text_subelement(container, 'formatRegistryKey', registry_key)
 
     return container
 
@@ -184,16 +172,12 @@ def compression(compression_scheme=None, local_list=None,
     container = _element('Compression')
 
     if compression_scheme:
-        compression_scheme_el = _subelement(container, 'compressionScheme')
-        compression_scheme_el.text = compression_scheme
+        _text_subelement(container, 'compressionScheme', compression_scheme)
 
     if compression_scheme == 'enumerated in local list':
-        local_list_el = _subelement(
-            container, 'compressionSchemeLocalList')
-        local_list_el.text = local_list
-        local_value_el = _subelement(
-            container, 'compressionSchemeLocalValue')
-        local_value_el.text = local_value
+        _text_subelement(container, 'compressionSchemeLocalList', local_list)
+        _text_subelement(
+            container, 'compressionSchemeLocalValue', local_value)
 
     if compression_ratio:
         _rationaltype_element('compressionRatio', compression_ratio,
@@ -223,20 +207,17 @@ def fixity(algorithm=None, digest=None, originator=None):
     container = _element('Fixity')
 
     if algorithm:
-        if algorithm in DIGEST_ALGORITHMS:
-            algorithm_el = _subelement(container, 'messageDigestAlgorithm')
-            algorithm_el.text = algorithm
+        if algorithm in DIGEST_ALGORITHMS_SET:
+            _text_subelement(container, 'messageDigestAlgorithm', algorithm)
         else:
             raise RestrictedElementError(
                 algorithm, 'messageDigestAlgorithm', DIGEST_ALGORITHMS)
 
     if digest:
-        digest_el = _subelement(container, 'messageDigest')
-        digest_el.text = digest
+        _text_subelement(container, 'messageDigest', digest)
 
     if originator:
-        originator_el = _subelement(container, 'messageDigestOriginator')
-        originator_el.text = originator
+        _text_subelement(container, 'messageDigestOriginator', originator)
 
     return container
 
@@ -254,7 +235,7 @@ def _normalized_byteorder(byte_order):
     byte_order = byte_order.replace('-', ' ').replace('_', ' ')
     byte_order = byte_order.lower()
 
-    if byte_order in BYTE_ORDER_TYPES:
+    if byte_order in BYTE_ORDER_TYPES_SET:
         return byte_order
 
     if 'big' in byte_order and 'endian' in byte_order:
@@ -12,9 +12,50 @@ class RestrictedElementError(Exception):
     """Raised when the value of a restricted element is invalid."""
 
     def __str__(self):
-        return ('The value "%s" is invalid for %s, accepted values '
-                'are: "%s".' % (self.args[0], self.args[1],
-                                '", "'.join(self.args[2])))
+        value, element, accepted = self.args
+        accepted = '", "'.join(accepted)
+        return (f'The value "{value}" is invalid for {element}, accepted '
+                f'values are: "{accepted}".')
+
+
+def _order_map(*tags):
+    """
+    Returns a dict mapping the namespaced tags to their position in the
+    given sequence. Used for placing elements in the schema order with a
+    single dict lookup per element.
+    """
+    return {'{%s}%s' % (MIX_NS, tag): index
+            for index, tag in enumerate(tags)}
+
+
+def _order_position(order, tag, container):
+    """
+    Returns the position of the element with the given namespaced tag
+    among the children of the given container element. Raises
+    ValueError if the element is not allowed in the container.
+    """
+    try:
+        return order[tag]
+    except KeyError:
+        raise ValueError(f'Element "{tag}" is not allowed in '
+                         f'{container}.') from None
+
+
+ASSESSMENT_METADATA_ORDER = _order_map(
+    'SpatialMetrics', 'ImageColorEncoding', 'TargetData')
+
+COLOR_ENCODING_ORDER = _order_map(
+    'BitsPerSample', 'samplesPerPixel', 'extraSamples', 'Colormap',
+    'GrayResponse', 'WhitePoint', 'PrimaryChromaticities')
+
+TARGET_DATA_ORDER = _order_map(
+    'targetType', 'TargetID', 'externalTarget', 'performanceData')
+
+
+MIX_ROOT_ORDER = _order_map(
+    'BasicDigitalObjectInformation', 'BasicImageInformation',
+    'ImageCaptureMetadata', 'ImageAssessmentMetadata', 'ChangeHistory',
+    'Extension')
 
 
 def mix_root_order(elem):
@@ -22,12 +63,12 @@ def mix_root_order(elem):
     Sorts the elements in the mix root element in the correct
     sequence.
     """
-    return ['{%s}BasicDigitalObjectInformation' % MIX_NS,
-            '{%s}BasicImageInformation' % MIX_NS,
-            '{%s}ImageCaptureMetadata' % MIX_NS,
-            '{%s}ImageAssessmentMetadata' % MIX_NS,
-            '{%s}ChangeHistory' % MIX_NS,
-            '{%s}Extension' % MIX_NS].index(elem.tag)
+    return _order_position(MIX_ROOT_ORDER, elem.tag, 'mix')
+
+
+BASIC_DO_ORDER = _order_map(
+    'ObjectIdentifier', 'fileSize', 'FormatDesignation', 'FormatRegistry',
+    'byteOrder', 'Compression', 'Fixity')
 
 
 def basic_do_order(elem):
@@ -35,13 +76,12 @@ def basic_do_order(elem):
     Sorts the elements in the BasicDigitalObjectInformation parent
     element in the correct sequence.
     """
-    return ['{%s}ObjectIdentifier' % MIX_NS,
-            '{%s}fileSize' % MIX_NS,
-            '{%s}FormatDesignation' % MIX_NS,
-            '{%s}FormatRegistry' % MIX_NS,
-            '{%s}byteOrder' % MIX_NS,
-            '{%s}Compression' % MIX_NS,
-            '{%s}Fixity' % MIX_NS].index(elem.tag)
+    return _order_position(
+        BASIC_DO_ORDER, elem.tag, 'BasicDigitalObjectInformation')
+
+
+IMAGE_INFORMATION_ORDER = _order_map(
+    'BasicImageCharacteristics', 'SpecialFormatCharacteristics')
 
 
 def image_information_order(elem):
@@ -49,8 +89,12 @@ def image_information_order(elem):
     Sorts the elements in the BasicImageInformation parent element in
     the correct sequence.
     """
-    return ['{%s}BasicImageCharacteristics' % MIX_NS,
-            '{%s}SpecialFormatCharacteristics' % MIX_NS].index(elem.tag)
+    return _order_position(
+        IMAGE_INFORMATION_ORDER, elem.tag, 'BasicImageInformation')
+
+
+PHOTOM_INTERPRET_ORDER = _order_map(
+    'colorSpace', 'ColorProfile', 'YCbCr', 'ReferenceBlackWhite')
 
 
 def photom_interpret_order(elem):
@@ -58,10 +102,13 @@ def photom_interpret_order(elem):
     Sorts the elements in the PhotometricInterpretation parent element
     in the correct sequence.
     """
-    return ['{%s}colorSpace' % MIX_NS,
-            '{%s}ColorProfile' % MIX_NS,
-            '{%s}YCbCr' % MIX_NS,
-            '{%s}ReferenceBlackWhite' % MIX_NS].index(elem.tag)
+    return _order_position(
+        PHOTOM_INTERPRET_ORDER, elem.tag, 'PhotometricInterpretation')
+
+
+IMAGE_CAPTURE_ORDER = _order_map(
+    'SourceInformation', 'GeneralCaptureInformation', 'ScannerCapture',
+    'DigitalCameraCapture', 'orientation', 'methodology')
 
 
 def image_capture_order(elem):
@@ -69,12 +116,12 @@ def image_capture_order(elem):
     Sorts the elements in the ImageCaptureMetadataType parent element in
     the correct sequence.
     """
-    return ['{%s}SourceInformation' % MIX_NS,
-            '{%s}GeneralCaptureInformation' % MIX_NS,
-            '{%s}ScannerCapture' % MIX_NS,
-            '{%s}DigitalCameraCapture' % MIX_NS,
-            '{%s}orientation' % MIX_NS,
-            '{%s}methodology' % MIX_NS].index(elem.tag)
+    return _order_position(
+        IMAGE_CAPTURE_ORDER, elem.tag, 'ImageCaptureMetadata')
+
+
+SOURCE_INFORMATION_ORDER = _order_map(
+    'sourceType', 'SourceID', 'SourceSize')
 
 
 def source_information_order(elem):
@@ -82,9 +129,13 @@ def source_information_order(elem):
     Sorts the elements in the SourceInformation parent element in the
     correct sequence.
     """
-    return ['{%s}sourceType' % MIX_NS,
-            '{%s}SourceID' % MIX_NS,
-            '{%s}SourceSize' % MIX_NS].index(elem.tag)
+    return _order_position(
+        SOURCE_INFORMATION_ORDER, elem.tag, 'SourceInformation')
+
+
+SCANNER_CAPTURE_ORDER = _order_map(
+    'scannerManufacturer', 'ScannerModel', 'MaximumOpticalResolution',
+    'scannerSensor', 'ScanningSystemSoftware')
 
 
 def scanner_capture_order(elem):
@@ -92,11 +143,12 @@ def scanner_capture_order(elem):
     Sorts the elements in the ScannerCapture parent element in the
     correct sequence.
     """
-    return ['{%s}scannerManufacturer' % MIX_NS,
-            '{%s}ScannerModel' % MIX_NS,
-            '{%s}MaximumOpticalResolution' % MIX_NS,
-            '{%s}scannerSensor' % MIX_NS,
-            '{%s}ScanningSystemSoftware' % MIX_NS].index(elem.tag)
+    return _order_position(SCANNER_CAPTURE_ORDER, elem.tag, 'ScannerCapture')
+
+
+CAMERA_CAPTURE_ORDER = _order_map(
+    'digitalCameraManufacturer', 'DigitalCameraModel', 'cameraSensor',
+    'CameraCaptureSettings')
 
 
 def camera_capture_order(elem):
@@ -104,10 +156,12 @@ def camera_capture_order(elem):
     Sorts the elements in the DigitalCameraCapture parent element in
     the correct sequence.
     """
-    return ['{%s}digitalCameraManufacturer' % MIX_NS,
-            '{%s}DigitalCameraModel' % MIX_NS,
-            '{%s}cameraSensor' % MIX_NS,
-            '{%s}CameraCaptureSettings' % MIX_NS].index(elem.tag)
+    return _order_position(
+        CAMERA_CAPTURE_ORDER, elem.tag, 'DigitalCameraCapture')
+
+
+CAMERA_CAPTURE_SETTINGS_ORDER = _order_map(
+    'ImageData', 'GPSData')
 
 
 def camera_capture_settings_order(elem):
@@ -115,8 +169,17 @@ def camera_capture_settings_order(elem):
     Sorts the elements in the CameraCaptureSettings parent element in
     the correct sequence.
     """
-    return ['{%s}ImageData' % MIX_NS,
-            '{%s}GPSData' % MIX_NS].index(elem.tag)
+    return _order_position(
+        CAMERA_CAPTURE_SETTINGS_ORDER, elem.tag, 'CameraCaptureSettings')
+
+
+IMAGE_DATA_ORDER = _order_map(
+    'fNumber', 'exposureTime', 'exposureProgram', 'spectralSensitivity',
+    'isoSpeedRatings', 'oECF', 'exifVersion', 'shutterSpeedValue',
+    'apertureValue', 'brightnessValue', 'exposureBiasValue',
+    'maxApertureValue', 'SubjectDistance', 'meteringMode', 'lightSource',
+    'flash', 'focalLength', 'flashEnergy', 'backLight', 'exposureIndex',
+    'sensingMethod', 'cfaPattern', 'autoFocus', 'PrintAspectRatio')
 
 
 def image_data_order(elem):
@@ -124,30 +187,19 @@ def image_data_order(elem):
     Sorts the elements in the ImageData parent element in the correct
     sequence.
     """
-    return ['{%s}fNumber' % MIX_NS,
-            '{%s}exposureTime' % MIX_NS,
-            '{%s}exposureProgram' % MIX_NS,
-            '{%s}spectralSensitivity' % MIX_NS,
-            '{%s}isoSpeedRatings' % MIX_NS,
-            '{%s}oECF' % MIX_NS,
-            '{%s}exifVersion' % MIX_NS,
-            '{%s}shutterSpeedValue' % MIX_NS,
-            '{%s}apertureValue' % MIX_NS,
-            '{%s}brightnessValue' % MIX_NS,
-            '{%s}exposureBiasValue' % MIX_NS,
-            '{%s}maxApertureValue' % MIX_NS,
-            '{%s}SubjectDistance' % MIX_NS,
-            '{%s}meteringMode' % MIX_NS,
-            '{%s}lightSource' % MIX_NS,
-            '{%s}flash' % MIX_NS,
-            '{%s}focalLength' % MIX_NS,
-            '{%s}flashEnergy' % MIX_NS,
-            '{%s}backLight' % MIX_NS,
-            '{%s}exposureIndex' % MIX_NS,
-            '{%s}sensingMethod' % MIX_NS,
-            '{%s}cfaPattern' % MIX_NS,
-            '{%s}autoFocus' % MIX_NS,
-            '{%s}PrintAspectRatio' % MIX_NS].index(elem.tag)
+    return _order_position(IMAGE_DATA_ORDER, elem.tag, 'ImageData')
+
+
+GPS_DATA_ORDER = _order_map(
+    'gpsVersionID', 'gpsLatitudeRef', 'GPSLatitude', 'gpsLongitudeRef',
+    'GPSLongitude', 'gpsAltitudeRef', 'gpsAltitude', 'gpsTimeStamp',
+    'gpsSatellites', 'gpsStatus', 'gpsMeasureMode', 'gpsDOP', 'gpsSpeedRef',
+    'gpsSpeed', 'gpsTrackRef', 'gpsTrack', 'gpsImgDirectionRef',
+    'gpsImgDirection', 'gpsMapDatum', 'gpsDestLatitudeRef', 'GPSDestLatitude',
+    'gpsDestLongitudeRef', 'GPSDestLongitude', 'gpsDestBearingRef',
+    'gpsDestBearing', 'gpsDestDistanceRef', 'gpsDestDistance',
+    'gpsProcessingMethod', 'gpsAreaInformation', 'gpsDateStamp',
+    'gpsDifferential')
 
 
 def gps_data_order(elem):
@@ -155,37 +207,7 @@ def gps_data_order(elem):
     Sorts the elements in the GPSData parent element in the correct
     sequence.
     """
-    return ['{%s}gpsVersionID' % MIX_NS,
-            '{%s}gpsLatitudeRef' % MIX_NS,
-            '{%s}GPSLatitude' % MIX_NS,
-            '{%s}gpsLongitudeRef' % MIX_NS,
-            '{%s}GPSLongitude' % MIX_NS,
-            '{%s}gpsAltitudeRef' % MIX_NS,
-            '{%s}gpsAltitude' % MIX_NS,
-            '{%s}gpsTimeStamp' % MIX_NS,
-            '{%s}gpsSatellites' % MIX_NS,
-            '{%s}gpsStatus' % MIX_NS,
-            '{%s}gpsMeasureMode' % MIX_NS,
-            '{%s}gpsDOP' % MIX_NS,
-            '{%s}gpsSpeedRef' % MIX_NS,
-            '{%s}gpsSpeed' % MIX_NS,
-            '{%s}gpsTrackRef' % MIX_NS,
-            '{%s}gpsTrack' % MIX_NS,
-            '{%s}gpsImgDirectionRef' % MIX_NS,
-            '{%s}gpsImgDirection' % MIX_NS,
-            '{%s}gpsMapDatum' % MIX_NS,
-            '{%s}gpsDestLatitudeRef' % MIX_NS,
-            '{%s}GPSDestLatitude' % MIX_NS,
-            '{%s}gpsDestLongitudeRef' % MIX_NS,
-            '{%s}GPSDestLongitude' % MIX_NS,
-            '{%s}gpsDestBearingRef' % MIX_NS,
-            '{%s}gpsDestBearing' % MIX_NS,
-            '{%s}gpsDestDistanceRef' % MIX_NS,
-            '{%s}gpsDestDistance' % MIX_NS,
-            '{%s}gpsProcessingMethod' % MIX_NS,
-            '{%s}gpsAreaInformation' % MIX_NS,
-            '{%s}gpsDateStamp' % MIX_NS,
-            '{%s}gpsDifferential' % MIX_NS].index(elem.tag)
+    return _order_position(GPS_DATA_ORDER, elem.tag, 'GPSData')
 
 
 def assessment_metadata_order(elem):
@@ -193,9 +215,8 @@ def assessment_metadata_order(elem):
     Sorts the elements in the ImageAssessmentMetadata parent element in
     the correct sequence.
     """
-    return ['{%s}SpatialMetrics' % MIX_NS,
-            '{%s}ImageColorEncoding' % MIX_NS,
-            '{%s}TargetData' % MIX_NS].index(elem.tag)
+    return _order_position(
+        ASSESSMENT_METADATA_ORDER, elem.tag, 'ImageAssessmentMetadata')
 
 
 def color_encoding_order(elem):
@@ -203,13 +224,8 @@ def color_encoding_order(elem):
     Sorts the elements in the ImageColorEncoding parent element in the
     correct sequence.
     """
-    return ['{%s}BitsPerSample' % MIX_NS,
-            '{%s}samplesPerPixel' % MIX_NS,
-            '{%s}extraSamples' % MIX_NS,
-            '{%s}Colormap' % MIX_NS,
-            '{%s}GrayResponse' % MIX_NS,
-            '{%s}WhitePoint' % MIX_NS,
-            '{%s}PrimaryChromaticities' % MIX_NS].index(elem.tag)
+    return _order_position(
+        COLOR_ENCODING_ORDER, elem.tag, 'ImageColorEncoding')
 
 
 def target_data_order(elem):
@@ -217,10 +233,11 @@ def target_data_order(elem):
     Sorts the elements in the TargetData parent element in the correct
     sequence.
     """
-    return ['{%s}targetType' % MIX_NS,
-            '{%s}TargetID' % MIX_NS,
-            '{%s}externalTarget' % MIX_NS,
-            '{%s}performanceData' % MIX_NS].index(elem.tag)
+    return _order_position(TARGET_DATA_ORDER, elem.tag, 'TargetData')
+
+
+CHANGE_HISTORY_ORDER = _order_map(
+    'ImageProcessing', 'PreviousImageMetadata')
 
 
 def change_history_order(elem):
@@ -228,8 +245,12 @@ def change_history_order(elem):
     Sorts the elements in the ChangeHistory parent element in the
     correct sequence.
     """
-    return ['{%s}ImageProcessing' % MIX_NS,
-            '{%s}PreviousImageMetadata' % MIX_NS].index(elem.tag)
+    return _order_position(CHANGE_HISTORY_ORDER, elem.tag, 'ChangeHistory')
+
+
+IMAGE_PROCESSING_ORDER = _order_map(
+    'dateTimeProcessed', 'sourceData', 'processingAgency',
+    'processingRationale', 'ProcessingSoftware', 'processingActions')
 
 
 def image_processing_order(elem):
@@ -237,9 +258,4 @@ def image_processing_order(elem):
     Sorts the elements in the ImageProcessing parent element in the
     correct sequence.
     """
-    return ['{%s}dateTimeProcessed' % MIX_NS,
-            '{%s}sourceData' % MIX_NS,
-            '{%s}processingAgency' % MIX_NS,
-            '{%s}processingRationale' % MIX_NS,
-            '{%s}ProcessingSoftware' % MIX_NS,
-            '{%s}processingActions' % MIX_NS].index(elem.tag)
+    return _order_position(IMAGE_PROCESSING_ORDER, elem.tag, 'ImageProcessing')
@@ -33,6 +33,109 @@ def test_assessment_metadata():
     assert h.compare_trees(mix, ET.fromstring(xml_str))
 
 
+def test_assessment_metadata_parent():
+    """
+    Test that the elements are created directly as subelements when a
+    parent element is given.
+    """
+    mix = image_assessment_metadata()
+    spatial = spatial_metrics(plane='object plane', parent=mix)
+    encoding = color_encoding(parent=mix)
+    bits_per_sample(sample_values=8, parent=encoding)
+    white_point(x_value=2, parent=encoding)
+    target = target_data(target_types='internal', parent=mix)
+    target_id(name='test', parent=target)
+
+    assert spatial.getparent() is mix
+    assert target.getparent() is mix
+
+    xml_str = ('<mix:ImageAssessmentMetadata xmlns:mix='
+               '"http://www.loc.gov/mix/v20"><mix:SpatialMetrics>'
+               '<mix:samplingFrequencyPlane>object plane'
+               '</mix:samplingFrequencyPlane></mix:SpatialMetrics>'
+               '<mix:ImageColorEncoding><mix:BitsPerSample>'
+               '<mix:bitsPerSampleValue>8</mix:bitsPerSampleValue>'
+               '</mix:BitsPerSample><mix:WhitePoint><mix:whitePointXValue>'
+               '<mix:numerator>2</mix:numerator><mix:denominator>1'
+               '</mix:denominator></mix:whitePointXValue></mix:WhitePoint>'
+               '</mix:ImageColorEncoding><mix:TargetData>'
+               '<mix:targetType>internal</mix:targetType><mix:TargetID>'
+               '<mix:targetName>test</mix:targetName></mix:TargetID>'
+               '</mix:TargetData></mix:ImageAssessmentMetadata>')
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
+def test_parent_order():
+    """
+    Tests that elements created into a parent element are placed in the
+    schema order regardless of the order of the calls.
+    """
+    mix = image_assessment_metadata()
+    target_data(parent=mix)
+    encoding = color_encoding(samples_pixel=3, parent=mix)
+    white_point(x_value=2, parent=encoding)
+    bits_per_sample(sample_values=8, parent=encoding)
+    spatial_metrics(parent=mix)
+
+    xml_str = ('<mix:ImageAssessmentMetadata xmlns:mix='
+               '"http://www.loc.gov/mix/v20"><mix:SpatialMetrics/>'
+               '<mix:ImageColorEncoding><mix:BitsPerSample>'
+               '<mix:bitsPerSampleValue>8</mix:bitsPerSampleValue>'
+               '</mix:BitsPerSample><mix:samplesPerPixel>3'
+               '</mix:samplesPerPixel><mix:WhitePoint><mix:whitePointXValue>'
+               '<mix:numerator>2</mix:numerator><mix:denominator>1'
+               '</mix:denominator></mix:whitePointXValue></mix:WhitePoint>'
+               '</mix:ImageColorEncoding><mix:TargetData/>'
+               '</mix:ImageAssessmentMetadata>')
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
+def test_parent_namespace():
+    """
+    Tests that the MIX namespace is mapped to the mix prefix when the
+    element is created into a parent element which does not declare the
+    namespace.
+    """
+    parent = ET.Element('{http://example.com/ns}xmlData',
+                        nsmap={'ex': 'http://example.com/ns'})
+    spatial_metrics(plane='object plane', parent=parent)
+
+    assert ET.tostring(parent) == (
+        b'<ex:xmlData xmlns:ex="http://example.com/ns">'
+        b'<mix:SpatialMetrics xmlns:mix="http://www.loc.gov/mix/v20">'
+        b'<mix:samplingFrequencyPlane>object plane'
+        b'</mix:samplingFrequencyPlane></mix:SpatialMetrics></ex:xmlData>')
+
+
+@pytest.mark.parametrize(('builder', 'kwargs'), [
+    (spatial_metrics, {'plane': 'foo'}),
+    (spatial_metrics, {'plane': 'object plane', 'unit': 'foo'}),
+    (color_encoding, {'samples_pixel': 3, 'extra_samples': 'foo'}),
+    (bits_per_sample, {'sample_values': [8], 'sample_unit': 'foo'}),
+    (gray_response, {'curves': [10], 'unit': 'foo'}),
+    (target_data, {'target_types': 'foo'}),
+    (image_assessment_metadata, {'child_elements': [_element('foo')]}),
+    (color_encoding, {'child_elements': [_element('foo')]}),
+    (target_data, {'child_elements': [_element('foo')]}),
+    (target_id, {'name': 'test'}),
+    (white_point, {'x_value': 2}),
+])
+def test_parent_error(builder, kwargs):
+    """
+    Tests that a builder which raises an error for an invalid restricted
+    value or child element, or for an element not allowed in the given
+    parent element, does not leave a partial element in the parent.
+    """
+    parent = image_assessment_metadata()
+
+    with pytest.raises((RestrictedElementError, ValueError)):
+        builder(parent=parent, **kwargs)
+
+    assert len(parent) == 0
+
+
 def test_spatial_metrics():
     """Test that the element SpatialMetrics is created correctly."""
 
@@ -225,6 +328,57 @@ def test_white_point():
     assert h.compare_trees(mix, ET.fromstring(xml_str))
 
 
+def test_white_point_zero():
+    """
+    Tests that zero values are kept and only missing values are left
+    out of the element WhitePoint.
+    """
+
+    mix = white_point(x_value=0)
+
+    xml_str = ('<mix:WhitePoint xmlns:mix="http://www.loc.gov/mix/v20">'
+               '<mix:whitePointXValue><mix:numerator>0</mix:numerator>'
+               '<mix:denominator>1</mix:denominator></mix:whitePointXValue>'
+               '</mix:WhitePoint>')
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
+@pytest.mark.parametrize(('builder', 'kwargs', 'tag'), [
+    (white_point, {'x_value': [], 'y_value': ''}, 'WhitePoint'),
+    (primary_chromaticities, {'red_x': [], 'red_y': ()},
+     'PrimaryChromaticities'),
+    (spatial_metrics, {'x_sampling': [], 'y_sampling': ''},
+     'SpatialMetrics'),
+])
+def test_empty_rational_values(builder, kwargs, tag):
+    """
+    Tests that empty rational type values are treated as missing values.
+    """
+    mix = builder(**kwargs)
+
+    xml_str = f'<mix:{tag} xmlns:mix="http://www.loc.gov/mix/v20"/>'
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
+@pytest.mark.parametrize(('builder', 'kwargs', 'tag'), [
+    (spatial_metrics, {'plane': '', 'unit': ''}, 'SpatialMetrics'),
+    (color_map, {'reference': '', 'embedded': ''}, 'Colormap'),
+    (target_id, {'manufacturer': '', 'name': ''}, 'TargetID'),
+])
+def test_empty_text_values(builder, kwargs, tag):
+    """
+    Tests that empty strings are treated as missing values for the
+    elements with text content.
+    """
+    mix = builder(**kwargs)
+
+    xml_str = f'<mix:{tag} xmlns:mix="http://www.loc.gov/mix/v20"/>'
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
 def test_primary_chromaticities():
     """
     Tests that the element PrimaryChromaticities is created
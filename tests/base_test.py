@@ -3,7 +3,10 @@
 import pytest
 import lxml.etree as ET
 from nisomix.base import (MIX_NS, mix_ns, mix, _element, _subelement,
-                          _rationaltype_element, _ensure_list)
+                          _append_ordered, _TextElement, _text_subelement,
+                          _text_subelements,
+                          _optional_subelements, _rationaltype_element,
+                          _ensure_list, _ensure_sequence)
 
 
 @pytest.mark.parametrize(('tag', 'prefix'), [
@@ -18,6 +21,28 @@ def test_mix_ns(tag, prefix):
     assert new_ns == f'{{{MIX_NS}}}{tag}'
 
 
+def test_mix_ns_cached():
+    """
+    Test that the namespaced tag names are cached separately for each
+    prefix and that the same string object is returned on later calls.
+    """
+    assert mix_ns('model') is mix_ns('model')
+    assert mix_ns('model', 'scanner') is mix_ns('model', 'scanner')
+    assert mix_ns('model') != mix_ns('model', 'scanner')
+
+
+def test_mix_ns_cache_bounded():
+    """
+    Test that the cache of namespaced tag names does not grow without
+    limit when arbitrary tags are given.
+    """
+    maxsize = mix_ns.cache_info().maxsize
+    for index in range(maxsize + 10):
+        mix_ns(f'dynamicTag{index}')
+
+    assert mix_ns.cache_info().currsize <= maxsize
+
+
 def test_element():
     """
     Tests the _element function by asserting that the element is created
@@ -52,6 +77,63 @@ def test_subelement():
         '<mix:preTest/></mix:test>'))
 
 
+def test_text_subelement():
+    """
+    Tests that the _text_subelement function creates a subelement with
+    the given text and prefix as a child of the given parent element.
+    """
+    elem = _element('test')
+    subelem = _text_subelement(elem, 'test', 'foo', prefix='pre')
+
+    assert subelem.getparent() == elem
+    assert ET.tostring(elem) == ET.tostring(ET.fromstring(
+        '<mix:test xmlns:mix="http://www.loc.gov/mix/v20">'
+        '<mix:preTest>foo</mix:preTest></mix:test>'))
+
+
+@pytest.mark.parametrize('count', [1, 100])
+def test_text_subelements(count):
+    """
+    Tests that the _text_subelements function creates a subelement for
+    each of the given values. Special characters must survive and
+    invalid characters must raise ValueError.
+    """
+    values = [f'<&>\r\n "{index}"' for index in range(count)]
+    elem = _element('test')
+    _text_subelements(elem, 'value', values)
+
+    assert len(elem) == count
+    assert [child.text for child in elem] == values
+    assert all(child.tag == mix_ns('value') for child in elem)
+    assert all(child.getparent() == elem for child in elem)
+    assert ET.tostring(elem).count(b'xmlns:mix') == 1
+
+    with pytest.raises(ValueError):
+        _text_subelements(_element('test'), 'value', ['\x00'] * count)
+
+
+def test_optional_subelements():
+    """
+    Tests that the _optional_subelements function creates a text
+    subelement for each given value in the given order and skips the
+    empty values.
+    """
+    elem = _element('test')
+    _optional_subelements(elem, (('first', 'a'), ('second', None),
+                                 ('third', ''), ('fourth', 4)))
+
+    assert ET.tostring(elem) == ET.tostring(ET.fromstring(
+        '<mix:test xmlns:mix="http://www.loc.gov/mix/v20">'
+        '<mix:first>a</mix:first><mix:fourth>4</mix:fourth></mix:test>'))
+
+    elem = _element('test')
+    _optional_subelements(elem, (('first', 'a'),), prefix='pre')
+
+    assert ET.tostring(elem) == ET.tostring(ET.fromstring(
+        '<mix:test xmlns:mix="http://www.loc.gov/mix/v20">'
+        '<mix:preFirst>a</mix:preFirst></mix:test>'))
+
+
 def test_rationaltype_element():
     """
     Tests the _rationaltype_element function by asserting that the
@@ -89,6 +171,13 @@ def test_rationaltype_element():
         '<mix:numerator>30</mix:numerator>'
         '<mix:denominator>1</mix:denominator></mix:test>'))
 
+    with pytest.raises(ValueError):
+        _rationaltype_element('test', [])
+
+    elem_tuple = _rationaltype_element('test', (30, 3))
+
+    assert ET.tostring(elem_tuple) == ET.tostring(elem2)
+
     parent = _element('parent')
     elem5 = _rationaltype_element('test', [30], parent=parent)
 
@@ -99,6 +188,38 @@ def test_rationaltype_element():
     assert elem5.getparent().tag == '{http://www.loc.gov/mix/v20}parent'
 
 
+def test_append_ordered():
+    """
+    Tests that the _append_ordered function appends both the child
+    elements and the text elements in the given order and keeps the
+    original order of the elements with the same tag.
+    """
+    order = {mix_ns('first'): 0, mix_ns('second'): 1, mix_ns('third'): 2}
+    elem = _element('test')
+    _append_ordered(
+        elem, [_element('third'), _element('first')], order,
+        [_TextElement(mix_ns('second'), 'a'),
+         _TextElement(mix_ns('second'), 'b')])
+
+    assert ET.tostring(elem) == ET.tostring(ET.fromstring(
+        '<mix:test xmlns:mix="http://www.loc.gov/mix/v20">'
+        '<mix:first/><mix:second>a</mix:second><mix:second>b</mix:second>'
+        '<mix:third/></mix:test>'))
+
+
+def test_append_ordered_unknown_element():
+    """
+    Tests that the _append_ordered function and the builders using it
+    raise ValueError naming the element and the container for elements
+    not allowed in the container.
+    """
+    with pytest.raises(ValueError) as error:
+        mix(child_elements=[_element('foo')])
+
+    assert str(error.value) == ('Element "{http://www.loc.gov/mix/v20}foo" '
+                                'is not allowed in mix.')
+
+
 @pytest.mark.parametrize(('value', 'length'), [
     ('test', 1),
     (4, 1),
@@ -113,6 +234,23 @@ def test_ensure_list(value, length):
     assert len(list_value) == length
 
 
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('test', ('test',)),
+    (4, (4,)),
+    (['test', 'test2'], ['test', 'test2']),
+    (('test', 'test2'), ('test', 'test2')),
+])
+def test_ensure_sequence(value, expected):
+    """
+    Tests that the _ensure_sequence function wraps single values in a
+    tuple and returns lists and tuples as they are.
+    """
+    sequence = _ensure_sequence(value)
+    assert sequence == expected
+    if isinstance(value, (list, tuple)):
+        assert sequence is value
+
+
 def test_mix():
     """
     Tests that the mix root element is created and tests that the child
@@ -13,7 +13,7 @@ from nisomix.capture_metadata_base import (_gps_group, camera_capture_settings,
                                            parse_datetime_created,
                                            scanning_software, source_id,
                                            source_information, source_size)
-from nisomix.utils import RestrictedElementError
+from nisomix.utils import NAMESPACES, RestrictedElementError
 
 
 def test_capture_metadata():
@@ -39,6 +39,28 @@ def test_capture_metadata():
     assert h.compare_trees(mix, ET.fromstring(xml_str))
 
 
+def test_child_elements_not_modified():
+    """
+    Tests that the builders do not add elements to or reorder the child
+    element list given by the caller.
+    """
+    children = [_element('DigitalCameraCapture'),
+                _element('SourceInformation')]
+    given = list(children)
+    image_capture_metadata(orientation='unknown', child_elements=children)
+    assert children == given
+
+    children = [_element('SourceSize'), _element('SourceID')]
+    given = list(children)
+    source_information(source_type='test', child_elements=children)
+    assert children == given
+
+    children = [_element('GPSData'), _element('ImageData')]
+    given = list(children)
+    camera_capture_settings(child_elements=children)
+    assert children == given
+
+
 def test_orientation_error():
     """
     Tests that invalid values for restricted elements return an
@@ -603,6 +625,20 @@ def test_gps_data_empty_key():
     assert h.compare_trees(mix, ET.fromstring(xml_str))
 
 
+def test_gps_data_partial_group():
+    """
+    Tests that a GPS group is created when only some of its values are
+    given.
+    """
+    mix = gps_data(contents={"long_minutes": 4})
+    xml_str = ('<mix:GPSData xmlns:mix="http://www.loc.gov/mix/v20">'
+               '<mix:GPSLongitude><mix:minutes><mix:numerator>4'
+               '</mix:numerator><mix:denominator>1</mix:denominator>'
+               '</mix:minutes></mix:GPSLongitude></mix:GPSData>')
+
+    assert h.compare_trees(mix, ET.fromstring(xml_str))
+
+
 def test_gps_data_dict_error():
     """Tests that unwanted keys in dict return an exception."""
     with pytest.raises(ValueError):
@@ -623,3 +659,24 @@ def test_parse_datetime_created():
 
     assert parse_datetime_created(
         ET.fromstring(xml_str)) == '2019-04-29T10:10:05'
+
+
+def test_parse_datetime_created_element():
+    """
+    Tests that the parse_datetime_created function returns the text of
+    the given dateTimeCreated element itself instead of the first one
+    in the document, and that None is returned if the element does not
+    exist.
+    """
+    xml_str = ('<mix:mix xmlns:mix="http://www.loc.gov/mix/v20">'
+               '<mix:GeneralCaptureInformation>'
+               '<mix:dateTimeCreated>2019-04-29T10:10:05</mix:dateTimeCreated>'
+               '</mix:GeneralCaptureInformation>'
+               '<mix:GeneralCaptureInformation>'
+               '<mix:dateTimeCreated>2020-01-01T00:00:00</mix:dateTimeCreated>'
+               '</mix:GeneralCaptureInformation></mix:mix>')
+    created = ET.fromstring(xml_str).xpath(
+        '//mix:dateTimeCreated', namespaces=NAMESPACES)[1]
+
+    assert parse_datetime_created(created) == '2020-01-01T00:00:00'
+    assert parse_datetime_created(_element('ImageCaptureMetadata')) is None
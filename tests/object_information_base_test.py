@@ -47,6 +47,18 @@ def test_digitalobjectinformation():
     assert mix.xpath('./*')[5].tag == '{http://www.loc.gov/mix/v20}Compression'
 
 
+def test_child_elements_not_modified():
+    """
+    Tests that digital_object_information does not add elements to or
+    reorder the child element list given by the caller.
+    """
+    children = [_element('Fixity'), _element('ObjectIdentifier')]
+    given = list(children)
+    digital_object_information(byte_order='big endian', file_size=1234,
+                               child_elements=children)
+    assert children == given
+
+
 def test_identifier():
     """Test that the element ObjectIdentifier is created correctly."""
 
@@ -0,0 +1,29 @@
+"""Test nisomix.utils module functions."""
+
+import pytest
+
+from nisomix.base import _element
+from nisomix.utils import RestrictedElementError, image_data_order
+
+
+def test_restricted_element_error():
+    """Test that the error message lists the accepted values."""
+    error = RestrictedElementError('foo', 'targetType',
+                                   ['external', 'internal'])
+
+    assert str(error) == ('The value "foo" is invalid for targetType, '
+                          'accepted values are: "external", "internal".')
+
+
+def test_order_unknown_element():
+    """
+    Test that the order functions raise ValueError naming the element
+    and the container for elements not allowed in the container.
+    """
+    assert image_data_order(_element('fNumber')) == 0
+
+    with pytest.raises(ValueError) as error:
+        image_data_order(_element('foo'))
+
+    assert str(error.value) == ('Element "{http://www.loc.gov/mix/v20}foo" '
+                                'is not allowed in ImageData.')